@@ -36,11 +36,12 @@ pw_zero = q("pairwise_similarity_yearly",
             params={"Year": "eq.2025", "CosineSimilarity": "eq.0"})
 print(f"Stored pairs with sim=0.0 in 2025: {len(pw_zero)}")
 
-afg_ven = [r for r in pw_zero
-           if r["Country1_ISO3"] in ("AFG", "VEN") or r["Country2_ISO3"] in ("AFG", "VEN")]
+# Split the zero pairs by whether they touch a zero-vote country, in one pass
+afg_ven, others = [], []
+for r in pw_zero:
+    touches = r["Country1_ISO3"] in ("AFG", "VEN") or r["Country2_ISO3"] in ("AFG", "VEN")
+    (afg_ven if touches else others).append(r)
 print(f"  Involving AFG/VEN: {len(afg_ven)}")
-others = [r for r in pw_zero
-          if r["Country1_ISO3"] not in ("AFG", "VEN") and r["Country2_ISO3"] not in ("AFG", "VEN")]
 print(f"  Other zero pairs: {len(others)}")
 
 # Which countries appear in these non-AFG/VEN zeros?
@@ -49,9 +50,17 @@ for r in others:
     c[r["Country1_ISO3"]] += 1
     c[r["Country2_ISO3"]] += 1
 
+# Fetch the 2025 vote totals for all listed countries in one request
+top = c.most_common(20)
+totals = {}
+if top:
+    ann = q("annual_scores", select="Country name,Total Votes in Year",
+            params={"Country name": f"in.({','.join(iso for iso, _ in top)})",
+                    "Year": "eq.2025"})
+    for r in ann:
+        totals.setdefault(r["Country name"], r["Total Votes in Year"])
+
 print(f"\nCountries most frequently in spurious zero pairs:")
-for iso, cnt in c.most_common(20):
-    ann = q("annual_scores", select="Total Votes in Year",
-            params={"Country name": f"eq.{iso}", "Year": "eq.2025"})
-    total = ann[0]["Total Votes in Year"] if ann else "N/A"
+for iso, cnt in top:
+    total = totals.get(iso, "N/A")
     print(f"  {iso}: {cnt} zero-sim pairs, Total Votes={total}")
@@ -206,11 +206,11 @@ topic_compare.to_csv(OUT_DIR / "p1_topic_alignment_changes.csv")
 # ══════════════════════════════════════════════════════════════════════════
 separator("5. Top / Bottom P1 ranked countries in 2025")
 
-top_bottom = df_2025.dropna(subset=["P1_Score"]).sort_values("P1_Score", ascending=False)
+scored_2025 = df_2025.dropna(subset=["P1_Score"])
 print(f"\nTop 15 countries by P1 Score (2025):")
-print(top_bottom.head(15)[["P1_Score", "P1_Rank"]].to_string())
+print(scored_2025.nlargest(15, "P1_Score")[["P1_Score", "P1_Rank"]].to_string())
 print(f"\nBottom 15 countries by P1 Score (2025):")
-print(top_bottom.tail(15)[["P1_Score", "P1_Rank"]].to_string())
+print(scored_2025.nsmallest(15, "P1_Score").iloc[::-1][["P1_Score", "P1_Rank"]].to_string())
 
 # ══════════════════════════════════════════════════════════════════════════
 # 6. P1 BY REGION (2024 vs 2025)
@@ -276,14 +276,14 @@ if len(df_res) > 0:
     
     print(f"\nTotal resolutions in 2025: {len(df_res)}")
     print(f"\n--- 20 Most Divisive Resolutions ---")
-    for _, r in df_res.head(20).iterrows():
-        print(f"  [{r['Resolution']}] DivScore={r['DivisiveScore']:.0f}  Yes={int(r['Yes'])} No={int(r['NoVote'])} Abs={int(r['Abstain'])}  |  {r['Title'][:80]}")
-        if pd.notna(r['Tags']):
-            print(f"     Tags: {r['Tags'][:120]}")
+    for r in df_res.head(20).itertuples(index=False):
+        print(f"  [{r.Resolution}] DivScore={r.DivisiveScore:.0f}  Yes={int(r.Yes)} No={int(r.NoVote)} Abs={int(r.Abstain)}  |  {r.Title[:80]}")
+        if pd.notna(r.Tags):
+            print(f"     Tags: {r.Tags[:120]}")
     
     print(f"\n--- 10 Most Consensual Resolutions ---")
-    for _, r in df_res.tail(10).iterrows():
-        print(f"  [{r['Resolution']}] Yes%={r['ConsensusPct']:.0f}  Yes={int(r['Yes'])} No={int(r['NoVote'])} Abs={int(r['Abstain'])}  |  {r['Title'][:80]}")
+    for r in df_res.tail(10).itertuples(index=False):
+        print(f"  [{r.Resolution}] Yes%={r.ConsensusPct:.0f}  Yes={int(r.Yes)} No={int(r.NoVote)} Abs={int(r.Abstain)}  |  {r.Title[:80]}")
 
     df_res.to_csv(OUT_DIR / "p1_resolutions_2025.csv", index=False)
 else:
@@ -315,8 +315,8 @@ print(full_trend.tail(10).to_string(index=False))
 # ══════════════════════════════════════════════════════════════════════════
 separator("10. Countries with >15-point P1 swings (potential leadership/policy changes)")
 
-big_movers = compare[compare["Change"].abs() > 15].copy()
-big_movers = big_movers.sort_values("Change")
+# sort_values already returns a new frame, so the slice needs no .copy() first
+big_movers = compare[compare["Change"].abs() > 15].sort_values("Change")
 
 # Add their voting patterns
 for iso in big_movers.index:
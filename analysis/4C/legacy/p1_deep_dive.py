@@ -149,11 +149,14 @@ df_trend.columns = ["Country", "Year", "P1_Score", "Yes", "No", "Total"]
 for c in ["P1_Score", "Yes", "No", "Total"]:
     df_trend[c] = pd.to_numeric(df_trend[c], errors="coerce")
 
+# Index once by (Country, Year) so each spotlight country is a hashed lookup
+trend_mi = df_trend.set_index(["Country", "Year"]).sort_index()
 for iso in key_countries:
-    country_data = df_trend[df_trend.Country == iso][["Year", "P1_Score", "Yes", "No", "Total"]]
-    if len(country_data) > 0:
-        print(f"\n{iso}:")
-        print(country_data.to_string(index=False))
+    if iso not in trend_mi.index.levels[0]:
+        continue
+    country_data = trend_mi.loc[iso, ["P1_Score", "Yes", "No", "Total"]].reset_index()
+    print(f"\n{iso}:")
+    print(country_data.to_string(index=False))
 
 # ══════════════════════════════════════════════════════════════════════════
 # 5. PAIRWISE SIMILARITY — who moved closer/further from USA in 2025
@@ -171,34 +174,35 @@ df_pw.columns = ["Year", "C1", "C2", "Sim"]
 df_pw["Sim"] = pd.to_numeric(df_pw["Sim"], errors="coerce")
 
 # Filter for pairs involving USA
-usa_pairs = df_pw[(df_pw.C1 == "USA") | (df_pw.C2 == "USA")].copy()
-usa_pairs["Other"] = usa_pairs.apply(lambda r: r.C2 if r.C1 == "USA" else r.C1, axis=1)
+usa_pairs = df_pw[(df_pw.C1 == "USA") | (df_pw.C2 == "USA")]
+# The partner is whichever side isn't USA: one vectorised select, not a Python
+# lambda per row; assign adds it without a defensive .copy() of the slice first
+usa_pairs = usa_pairs.assign(Other=np.where(usa_pairs.C1 == "USA", usa_pairs.C2, usa_pairs.C1))
 
 usa_sim = usa_pairs.pivot_table(index="Other", columns="Year", values="Sim")
 usa_sim.columns = ["Sim_2024", "Sim_2025"]
 usa_sim["Sim_Change"] = usa_sim["Sim_2025"] - usa_sim["Sim_2024"]
 usa_sim = usa_sim.dropna()
-usa_sim = usa_sim.sort_values("Sim_Change")
 
+# Only the two ends are printed, so select them instead of sorting every partner
 print(f"\nCountries moving AWAY from USA (top 15):")
-print(usa_sim.head(15).to_string())
+print(usa_sim.nsmallest(15, "Sim_Change").to_string())
 print(f"\nCountries moving CLOSER to USA (top 15):")
-print(usa_sim.tail(15).to_string())
+print(usa_sim.nlargest(15, "Sim_Change").iloc[::-1].to_string())
 
 # Same for CHN and RUS
 for power in ["CHN", "RUS"]:
     separator(f"5b. Pairwise similarity with {power} — 2024 vs 2025")
-    p_pairs = df_pw[(df_pw.C1 == power) | (df_pw.C2 == power)].copy()
-    p_pairs["Other"] = p_pairs.apply(lambda r: r.C2 if r.C1 == power else r.C1, axis=1)
+    p_pairs = df_pw[(df_pw.C1 == power) | (df_pw.C2 == power)]
+    p_pairs = p_pairs.assign(Other=np.where(p_pairs.C1 == power, p_pairs.C2, p_pairs.C1))
     p_sim = p_pairs.pivot_table(index="Other", columns="Year", values="Sim")
     p_sim.columns = ["Sim_2024", "Sim_2025"]
     p_sim["Sim_Change"] = p_sim["Sim_2025"] - p_sim["Sim_2024"]
     p_sim = p_sim.dropna()
-    p_sim = p_sim.sort_values("Sim_Change")
     print(f"\nCountries moving AWAY from {power} (top 10):")
-    print(p_sim.head(10).to_string())
+    print(p_sim.nsmallest(10, "Sim_Change").to_string())
     print(f"\nCountries moving CLOSER to {power} (top 10):")
-    print(p_sim.tail(10).to_string())
+    print(p_sim.nlargest(10, "Sim_Change").iloc[::-1].to_string())
 
 # ══════════════════════════════════════════════════════════════════════════
 # 6. DOMINICA — detailed analysis (biggest dropper)
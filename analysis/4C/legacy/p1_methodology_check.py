@@ -45,6 +45,23 @@ def query_supabase(table, select="*", params=None, limit=10000):
                 break
     return all_rows
 
+def topic_lines(df):
+    """The per-topic report lines for df, formatted column-wise in one pass."""
+    counts = {c: df[c].astype(int).astype(str) for c in ["Yes", "No", "Abstain", "Total"]}
+    lines = ("    " + df["Topic"].str[:50].str.ljust(50)
+             + " Y=" + counts["Yes"] + " N=" + counts["No"]
+             + " A=" + counts["Abstain"] + " T=" + counts["Total"]
+             + " Cons=" + df["Consistency"].astype(str) + "%")
+    return "\n".join(lines)
+
+
+def resolution_lines(df, vote_col):
+    """One '[vote] resolution title' line per row of df, built column-wise."""
+    votes = df[vote_col].astype(str).where(df[vote_col].notna(), "NOVOTE")
+    lines = ("  [" + votes.str.rjust(7) + "] " + df["Resolution"].str.ljust(15)
+             + " " + df["Title"].str[:70])
+    return "\n".join(lines)
+
 
 # ══════════════════════════════════════════════════════════════════════════
 # 1. Within-topic voting consistency for ARG, ISR, USA, BRA in 2025
@@ -92,15 +109,13 @@ for iso in countries:
     inconsistent = df[df.Total > 1].nsmallest(5, "Consistency")
     if len(inconsistent) > 0:
         print(f"  Most inconsistent topics:")
-        for _, r in inconsistent.iterrows():
-            print(f"    {r['Topic'][:50]:50s} Y={int(r['Yes'])} N={int(r['No'])} A={int(r['Abstain'])} T={int(r['Total'])} Cons={r['Consistency']}%")
+        print(topic_lines(inconsistent))
     
     # Show most consistent topics
     consistent = df[df.Total > 2].nlargest(3, "Consistency")
     if len(consistent) > 0:
         print(f"  Most consistent topics:")
-        for _, r in consistent.iterrows():
-            print(f"    {r['Topic'][:50]:50s} Y={int(r['Yes'])} N={int(r['No'])} A={int(r['Abstain'])} T={int(r['Total'])} Cons={r['Consistency']}%")
+        print(topic_lines(consistent))
 
 # ══════════════════════════════════════════════════════════════════════════
 # 2. Compare ARG vote patterns across topics: how scattered?
@@ -169,9 +184,8 @@ print(f"Total resolutions: {len(df_raw)}")
 # Focus on HUMAN RIGHTS tag
 hr_resolutions = df_raw[df_raw.Tags.str.contains("HUMAN RIGHTS", case=False, na=False)]
 print(f"\nHUMAN RIGHTS tagged resolutions ({len(hr_resolutions)}):")
-for _, r in hr_resolutions.iterrows():
-        vote = str(r['ARG_Vote']) if pd.notna(r['ARG_Vote']) else 'NOVOTE'
-        print(f"  [{vote:>7s}] {r['Resolution']:15s} {r['Title'][:70]}")
+if len(hr_resolutions):
+    print(resolution_lines(hr_resolutions, "ARG_Vote"))
 # ══════════════════════════════════════════════════════════════════════════
 # 5. Same for ISR
 # ══════════════════════════════════════════════════════════════════════════
@@ -192,37 +206,37 @@ print(vote_counts_isr.to_string())
 # ISR on human rights
 hr_isr = df_isr_raw[df_isr_raw.Tags.str.contains("HUMAN RIGHTS", case=False, na=False)]
 print(f"\nHUMAN RIGHTS tagged ({len(hr_isr)}):")
-for _, r in hr_isr.iterrows():
-        vote = str(r['ISR_Vote']) if pd.notna(r['ISR_Vote']) else 'NOVOTE'
-        print(f"  [{vote:>7s}] {r['Resolution']:15s} {r['Title'][:70]}")
+if len(hr_isr):
+    print(resolution_lines(hr_isr, "ISR_Vote"))
 # ══════════════════════════════════════════════════════════════════════════
 # 6. Entropy-based consistency measure: compare ARG vs ISR
 # ══════════════════════════════════════════════════════════════════════════
 separator("6. Entropy-based consistency per topic")
 
-from math import log2
+def topic_entropy(df):
+    """Shannon entropy of each row's vote distribution (0 = perfectly consistent, max ~1.58).
 
-def topic_entropy(yes, no, abstain, total):
-    """Shannon entropy of vote distribution (0 = perfectly consistent, max ~1.58)"""
-    if total == 0:
-        return 0
-    probs = []
-    for v in [yes, no, abstain]:
-        p = v / total
-        if p > 0:
-            probs.append(p)
-    return -sum(p * log2(p) for p in probs)
+    Computed on the (topics x 3) share matrix at once rather than a Python
+    call per row; zero (and undefined) shares contribute nothing, and rows
+    with Total == 0 score 0.
+    """
+    counts = df[["Yes", "No", "Abstain"]].to_numpy(dtype=float)
+    total = df["Total"].to_numpy(dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        p = counts / total[:, None]
+        terms = np.where(p > 0, p * np.log2(np.where(p > 0, p, 1)), 0.0)
+    # + 0.0 turns the -0.0 of an all-zero row into 0.0
+    return np.where(total == 0, 0.0, -terms.sum(axis=1) + 0.0)
 
 for iso, df_country in [("ARG", df_arg), ("ISR", df_isr)]:
-    df_c = df_country.copy()
-    df_c["Entropy"] = df_c.apply(lambda r: topic_entropy(r["Yes"], r["No"], r["Abstain"], r["Total"]), axis=1)
+    df_c = df_country.assign(Entropy=topic_entropy(df_country))
     avg_entropy = (df_c["Entropy"] * df_c["Total"]).sum() / df_c["Total"].sum()
     print(f"\n{iso}: Weighted avg entropy = {avg_entropy:.3f} (0=consistent, 1.58=max disorder)")
     
     # Show high-entropy topics
     high_e = df_c[df_c.Total > 2].nlargest(5, "Entropy")
-    for _, r in high_e.iterrows():
-        print(f"  Entropy={r['Entropy']:.2f}  {r['Topic'][:50]:50s} Y={int(r['Yes'])} N={int(r['No'])} A={int(r['Abstain'])}")
+    for r in high_e.itertuples(index=False):
+        print(f"  Entropy={r.Entropy:.2f}  {r.Topic[:50]:50s} Y={int(r.Yes)} N={int(r.No)} A={int(r.Abstain)}")
 
 # ══════════════════════════════════════════════════════════════════════════
 # 7. Quick check: what about resolution-level consistency (not topic)?
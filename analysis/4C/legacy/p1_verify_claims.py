@@ -124,9 +124,9 @@ df_tags.columns = ["Title", "Tags"]
 # Search for disarmament-related titles
 disarm_titles = df_tags[df_tags.Title.str.contains("disarm|nuclear|weapon|arms", case=False, na=False)]
 print(f"Resolutions in 2025 with disarmament-related titles: {len(disarm_titles)}")
-for _, r in disarm_titles.iterrows():
-    tags = r['Tags'][:100] if pd.notna(r['Tags']) else 'None'
-    print(f"  • {r['Title'][:80]}")
+for r in disarm_titles.itertuples(index=False):
+    tags = r.Tags[:100] if pd.notna(r.Tags) else 'None'
+    print(f"  • {r.Title[:80]}")
     print(f"    Tags: {tags}")
 
 # Also check if DISARMAMENT tag exists in topic_votes for 2025
@@ -167,7 +167,10 @@ df_all["P1"] = pd.to_numeric(df_all["P1"], errors="coerce")
 
 d24 = df_all[df_all.Year == 2024].set_index("Country")["P1"]
 d25 = df_all[df_all.Year == 2025].set_index("Country")["P1"]
-both = pd.DataFrame({"P1_24": d24, "P1_25": d25}).dropna()
+# Inner join on the country index (sorted, as the aligned frame was) rather
+# than aligning on the union and dropping the one-year-only rows afterwards;
+# dropna still removes countries with a null P1 in either year
+both = d24.rename("P1_24").to_frame().join(d25.rename("P1_25"), how="inner", sort=True).dropna()
 both["Change"] = both["P1_25"] - both["P1_24"]
 
 avg_24 = d24.mean()
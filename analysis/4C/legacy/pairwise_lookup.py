@@ -0,0 +1,19 @@
+"""
+Shared lookup of stored pairwise cosine similarities for the Supabase audits.
+"""
+import numpy as np
+import pandas as pd
+
+
+def stored_similarity_by_pair(df_pw):
+    """CosineSimilarity keyed by (lower, higher) ISO3, first row per pair.
+
+    Each test pair is then one lookup in either orientation. Null ISO3 codes
+    become "" so the ordering never compares a string with None; such rows can
+    never match a real pair, as with the old per-pair row filter.
+    """
+    c1 = df_pw["Country1_ISO3"].fillna("").to_numpy(dtype=object)
+    c2 = df_pw["Country2_ISO3"].fillna("").to_numpy(dtype=object)
+    by_pair = pd.Series(df_pw["CosineSimilarity"].to_numpy(),
+                        index=pd.MultiIndex.from_arrays([np.minimum(c1, c2), np.maximum(c1, c2)]))
+    return by_pair[~by_pair.index.duplicated()]
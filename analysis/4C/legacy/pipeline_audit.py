@@ -2,7 +2,7 @@
 Pipeline Audit — identify all scraper / pipeline / aggregation issues
 for engineer handoff.
 """
-import os, json, urllib.request, urllib.parse, ssl, ast
+import os, json, urllib.request, urllib.parse, ssl, ast, re
 from pathlib import Path
 from dotenv import load_dotenv
 import pandas as pd
@@ -54,8 +54,8 @@ tv_rows = query_supabase("topic_votes_yearly", select="TopicTag",
                          params={"Year": "eq.2025"}, limit=200000)
 tv_df = pd.DataFrame(tv_rows)
 tags_2025_tv = set(tv_df["TopicTag"].unique())
-disarm_tv = [t for t in tags_2025_tv if "DISARM" in t.upper() or "WEAPON" in t.upper()
-             or "NUCLEAR" in t.upper() or "ARMS" in t.upper() or "MILITARY" in t.upper()]
+DISARM_PATTERN = re.compile(r"DISARM|WEAPON|NUCLEAR|ARMS|MILITARY", re.IGNORECASE)
+disarm_tv = [t for t in tags_2025_tv if DISARM_PATTERN.search(t)]
 print(f"Tags in topic_votes_yearly 2025: {len(tags_2025_tv)}")
 print(f"Disarmament-related tags in topic_votes: {disarm_tv if disarm_tv else 'NONE'}")
 
@@ -65,23 +65,20 @@ raw_rows = query_supabase("un_votes_raw", select="Title,tags",
 raw_df = pd.DataFrame(raw_rows)
 
 # Parse raw tags
-all_raw_tags = set()
-for _, r in raw_df.iterrows():
-    if pd.notna(r["tags"]):
-        t = str(r["tags"])
-        try:
-            tl = ast.literal_eval(t)
-            if isinstance(tl, list):
-                for item in tl:
-                    all_raw_tags.add(str(item).strip())
-                continue
-        except:
-            pass
-        for part in t.split(","):
-            all_raw_tags.add(part.strip().strip('"').strip("'"))
-
-disarm_raw = [t for t in all_raw_tags if "DISARM" in t.upper() or "WEAPON" in t.upper()
-              or "NUCLEAR" in t.upper() or "ARMS" in t.upper() or "MILITARY" in t.upper()]
+def split_tags(t):
+    """Tags arrive either as a Python-literal list or a comma-separated string."""
+    try:
+        tl = ast.literal_eval(t)
+        if isinstance(tl, list):
+            return [str(item).strip() for item in tl]
+    except:
+        pass
+    return [part.strip().strip('"').strip("'") for part in t.split(",")]
+
+raw_tags = raw_df["tags"].dropna().astype(str)
+all_raw_tags = {tag for t in raw_tags.tolist() for tag in split_tags(t)}
+
+disarm_raw = [t for t in all_raw_tags if DISARM_PATTERN.search(t)]
 print(f"\nTags in un_votes_raw 2025: {len(all_raw_tags)}")
 print(f"Disarmament-related tags in raw: {disarm_raw}")
 
@@ -89,8 +86,8 @@ print(f"Disarmament-related tags in raw: {disarm_raw}")
 disarm_titles = raw_df[raw_df["Title"].str.contains(
     "disarm|nuclear|weapon|arms control", case=False, na=False)]
 print(f"\nResolutions with disarmament keywords in TITLE: {len(disarm_titles)}")
-for _, r in disarm_titles.head(10).iterrows():
-    print(f"  • {r['Title'][:90]}")
+for r in disarm_titles.head(10).itertuples(index=False):
+    print(f"  • {r.Title[:90]}")
 
 # Full tag gap analysis
 missing_from_tv = all_raw_tags - tags_2025_tv
@@ -99,7 +96,7 @@ print(f"\n--- TAG GAP ANALYSIS ---")
 print(f"Tags in raw but MISSING from topic_votes: {len(missing_from_tv)}")
 for t in sorted(missing_from_tv):
     # Count how many resolutions have this tag
-    count = sum(1 for _, r in raw_df.iterrows() if pd.notna(r["tags"]) and t in str(r["tags"]))
+    count = int(raw_tags.str.contains(t, regex=False).sum())
     print(f"  • {t} ({count} resolutions)")
 print(f"\nTags in topic_votes but NOT in raw: {len(extra_in_tv)}")
 for t in sorted(extra_in_tv):
@@ -207,15 +204,22 @@ separator("7. Multi-tag inflation: topic_votes sum vs annual_scores total (2025)
 
 # Get annual totals for a sample of countries
 sample_countries = ["USA", "GBR", "BRA", "CHN", "ARG", "ISR", "FRA", "IND"]
+# Two requests for the whole sample instead of two per country; the topic
+# rows are then summed per country in one pass
+sample_filter = f"in.({','.join(sample_countries)})"
+ann_totals = {}
+for r in query_supabase("annual_scores",
+        select="Country name,Total Votes in Year",
+        params={"Country name": sample_filter, "Year": "eq.2025"}):
+    ann_totals.setdefault(r["Country name"], int(r["Total Votes in Year"]))
+tv_sums = {}
+for r in query_supabase("topic_votes_yearly",
+        select="Country,TotalVotes_Topic",
+        params={"Country": sample_filter, "Year": "eq.2025"}, limit=50000):
+    tv_sums[r["Country"]] = tv_sums.get(r["Country"], 0) + int(r["TotalVotes_Topic"])
 for iso in sample_countries:
-    ann = query_supabase("annual_scores",
-        select="Total Votes in Year",
-        params={"Country name": f"eq.{iso}", "Year": "eq.2025"})
-    tv = query_supabase("topic_votes_yearly",
-        select="TotalVotes_Topic",
-        params={"Country": f"eq.{iso}", "Year": "eq.2025"}, limit=200)
-    ann_total = int(ann[0]["Total Votes in Year"]) if ann else 0
-    tv_sum = sum(int(r["TotalVotes_Topic"]) for r in tv)
+    ann_total = ann_totals.get(iso, 0)
+    tv_sum = tv_sums.get(iso, 0)
     ratio = tv_sum / ann_total if ann_total > 0 else 0
     print(f"  {iso}: annual={ann_total}, topic_sum={tv_sum}, ratio={ratio:.1f}x")
 
@@ -234,8 +238,8 @@ mismatch = df_dates[df_dates["ActualYear"] != df_dates["Scrape_Year"]]
 print(f"Total 2025 resolutions: {len(df_dates)}")
 print(f"Where Date year != Scrape_Year: {len(mismatch)}")
 if len(mismatch) > 0:
-    for _, r in mismatch.iterrows():
-        print(f"  {r['Resolution']}: Date={r['Date'][:10]}, Scrape_Year={r['Scrape_Year']}")
+    for r in mismatch.itertuples(index=False):
+        print(f"  {r.Resolution}: Date={r.Date[:10]}, Scrape_Year={r.Scrape_Year}")
 
 # Date range
 print(f"\nDate range of '2025' resolutions:")
@@ -258,8 +262,10 @@ df_arith = pd.DataFrame(rows)
 df_arith.columns = ["Country", "Yes", "No", "Abstain", "Total"]
 for c in ["Yes", "No", "Abstain", "Total"]:
     df_arith[c] = pd.to_numeric(df_arith[c], errors="coerce")
-df_arith["Sum"] = df_arith["Yes"] + df_arith["No"] + df_arith["Abstain"]
-bad_arith = df_arith[df_arith["Sum"] != df_arith["Total"]]
+# Compared on the bare arrays; only failing rows get a Sum column copied out
+vote_sum = df_arith["Yes"].to_numpy() + df_arith["No"].to_numpy() + df_arith["Abstain"].to_numpy()
+bad = vote_sum != df_arith["Total"].to_numpy()
+bad_arith = df_arith[bad].assign(Sum=vote_sum[bad])
 print(f"Countries where Yes+No+Abstain != Total: {len(bad_arith)}")
 if len(bad_arith) > 0:
     print(bad_arith.to_string(index=False))
@@ -321,12 +327,13 @@ separator("12. Country coverage mismatch across tables (2025)")
 ann_c = set(r["Country name"] for r in query_supabase("annual_scores",
     select="Country name", params={"Year": "eq.2025"}, limit=200))
 
-# pairwise countries
-pw_c1 = set(r["Country1_ISO3"] for r in query_supabase("pairwise_similarity_yearly",
-    select="Country1_ISO3", params={"Year": "eq.2025"}, limit=50000))
-pw_c2 = set(r["Country2_ISO3"] for r in query_supabase("pairwise_similarity_yearly",
-    select="Country2_ISO3", params={"Year": "eq.2025"}, limit=50000))
-pw_c = pw_c1 | pw_c2
+# pairwise countries: both ISO3 columns from one paged fetch of the pair table,
+# gathered into a single set in one pass
+pw_c = set()
+for r in query_supabase("pairwise_similarity_yearly",
+        select="Country1_ISO3,Country2_ISO3", params={"Year": "eq.2025"}, limit=50000):
+    pw_c.add(r["Country1_ISO3"])
+    pw_c.add(r["Country2_ISO3"])
 
 # topic_votes countries
 tv_c = set(r["Country"] for r in query_supabase("topic_votes_yearly",
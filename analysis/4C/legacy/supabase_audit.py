@@ -14,6 +14,7 @@ from collections import Counter
 from dotenv import load_dotenv
 import pandas as pd
 import numpy as np
+from pairwise_lookup import stored_similarity_by_pair
 
 env_path = Path(__file__).parent.parent.parent / ".env"
 load_dotenv(env_path)
@@ -72,8 +73,10 @@ for c in ["P1","P1Rank","P2","P3","TotalIdx","OverallRank","Yes","No","Abstain",
 print(f"Countries: {len(df_ann)}")
 
 # 1a. Vote arithmetic
-df_ann["Sum"] = df_ann["Yes"] + df_ann["No"] + df_ann["Abstain"]
-bad_arith = df_ann[df_ann["Sum"] != df_ann["Total"]]
+# Compared on the bare arrays; only failing rows get a Sum column copied out
+vote_sum = df_ann["Yes"].to_numpy() + df_ann["No"].to_numpy() + df_ann["Abstain"].to_numpy()
+bad = vote_sum != df_ann["Total"].to_numpy()
+bad_arith = df_ann[bad].assign(Sum=vote_sum[bad])
 if len(bad_arith) == 0:
     print("✓ Vote arithmetic (Y+N+A==Total): ALL PASS")
     passes.append("annual_scores: vote arithmetic passes for all 2025 rows")
@@ -93,10 +96,11 @@ else:
     issues.append(f"annual_scores: {len(p1_out)} P1 scores out of range")
 
 # 1c. P1 nulls
-p1_null = df_ann["P1"].isna().sum()
+p1_missing = df_ann["P1"].isna()
+p1_null = p1_missing.sum()
 print(f"P1 nulls in 2025: {p1_null}")
 if p1_null > 0:
-    nulls = df_ann[df_ann["P1"].isna()]
+    nulls = df_ann[p1_missing]
     print(f"  Countries with null P1: {sorted(nulls['Country'].tolist())}")
     issues.append(f"annual_scores: {p1_null} countries with NULL P1 in 2025")
 else:
@@ -104,12 +108,12 @@ else:
 
 # 1d. P1 Rank consistency — does rank ordering match P1 score ordering?
 ranked = df_ann.dropna(subset=["P1","P1Rank"]).sort_values("P1Rank")
-rank_issues = 0
-for i in range(len(ranked) - 1):
-    if ranked.iloc[i]["P1"] < ranked.iloc[i+1]["P1"]:
-        # Higher-ranked country has lower P1 — wrong
-        if abs(ranked.iloc[i]["P1"] - ranked.iloc[i+1]["P1"]) > 0.01:
-            rank_issues += 1
+# Compare each score with the next one down the ranking as two shifted array
+# views instead of two .iloc row lookups per step
+p1 = ranked["P1"].to_numpy()
+higher, lower = p1[:-1], p1[1:]
+# Higher-ranked country has lower P1 (by more than rounding) — wrong
+rank_issues = int(np.count_nonzero((higher < lower) & (np.abs(higher - lower) > 0.01)))
 if rank_issues == 0:
     print("✓ P1 Rank ordering is consistent with P1 Score ordering")
     passes.append("annual_scores: P1 rank consistent with score")
@@ -120,22 +124,24 @@ else:
 # 1e. Total votes per country — distribution
 print(f"\nVote count distribution:")
 print(f"  Mean total votes: {df_ann['Total'].mean():.1f}")
-print(f"  Min: {df_ann['Total'].min()} ({df_ann.loc[df_ann['Total'].idxmin(), 'Country']})")
-print(f"  Max: {df_ann['Total'].max()} ({df_ann.loc[df_ann['Total'].idxmax(), 'Country']})")
+# Locate the extreme rows once and read both value and country off each
+i_min, i_max = df_ann["Total"].idxmin(), df_ann["Total"].idxmax()
+print(f"  Min: {df_ann.at[i_min, 'Total']} ({df_ann.at[i_min, 'Country']})")
+print(f"  Max: {df_ann.at[i_max, 'Total']} ({df_ann.at[i_max, 'Country']})")
 low_voters = df_ann[df_ann["Total"] < 20]
 print(f"  Countries with <20 votes: {len(low_voters)}")
 if len(low_voters) > 0:
-    for _, r in low_voters.iterrows():
-        print(f"    {r['Country']}: {int(r['Total'])} votes, P1={r['P1']}")
+    for r in low_voters.itertuples(index=False):
+        print(f"    {r.Country}: {int(r.Total)} votes, P1={r.P1}")
 
 # 1f. Duplicate check
-dupes = df_ann.duplicated(subset=["Country"], keep=False)
-if dupes.sum() == 0:
+dupe_count = int(df_ann.duplicated(subset=["Country"], keep=False).sum())
+if dupe_count == 0:
     print("✓ No duplicate countries in annual_scores 2025")
     passes.append("annual_scores: no duplicate country rows")
 else:
-    print(f"❌ {dupes.sum()} duplicate country rows")
-    issues.append(f"annual_scores: {dupes.sum()} duplicate rows")
+    print(f"❌ {dupe_count} duplicate country rows")
+    issues.append(f"annual_scores: {dupe_count} duplicate rows")
 
 # ══════════════════════════════════════════════════════════════════════════
 # TABLE 2: un_votes_raw — ground truth for cross-checking
@@ -158,30 +164,33 @@ print(f"Country columns: {len(country_cols)}")
 
 # 2a. Cross-check: recompute Y/N/A per country from raw & compare to annual_scores
 print("\n--- Cross-checking vote counts: un_votes_raw vs annual_scores ---")
-mismatches = []
-for _, ann_row in df_ann.iterrows():
-    iso = ann_row["Country"]
-    if iso not in country_cols:
-        continue
-    raw_votes = df_raw[iso]
-    raw_yes = (raw_votes == "YES").sum()
-    raw_no = (raw_votes == "NO").sum()
-    raw_abs = (raw_votes == "ABSTAIN").sum()
-    raw_total = raw_yes + raw_no + raw_abs
-
-    ann_yes = int(ann_row["Yes"])
-    ann_no = int(ann_row["No"])
-    ann_abs = int(ann_row["Abstain"])
-    ann_total = int(ann_row["Total"])
-
-    if raw_yes != ann_yes or raw_no != ann_no or raw_abs != ann_abs or raw_total != ann_total:
-        mismatches.append({
-            "Country": iso,
-            "raw_Y": raw_yes, "ann_Y": ann_yes,
-            "raw_N": raw_no, "ann_N": ann_no,
-            "raw_A": raw_abs, "ann_A": ann_abs,
-            "raw_T": raw_total, "ann_T": ann_total,
-        })
+# Count every country column at once instead of re-scanning df_raw per country
+votes_block = df_raw[country_cols]
+# Encode the block once as vote codes (0=YES, 1=NO, 2=ABSTAIN, -1 for anything
+# else) so the tallies here and in 2c are small-int compares rather than
+# string compares over every cell
+vote_codes = pd.Index(["YES", "NO", "ABSTAIN"]).get_indexer(
+    votes_block.to_numpy().ravel()).reshape(votes_block.shape)
+is_yes, is_no, is_abs = (vote_codes == k for k in range(3))
+raw_counts = pd.DataFrame({
+    "raw_Y": is_yes.sum(axis=0),
+    "raw_N": is_no.sum(axis=0),
+    "raw_A": is_abs.sum(axis=0),
+}, index=country_cols)
+raw_counts["raw_T"] = raw_counts["raw_Y"] + raw_counts["raw_N"] + raw_counts["raw_A"]
+
+ann_cmp = df_ann[df_ann["Country"].isin(country_cols)]
+raw_cmp = raw_counts.loc[ann_cmp["Country"]]
+# Y/N/A/T side by side as two (countries x 4) blocks: one elementwise compare
+# flags every mismatching cell, instead of four column compares OR-ed together
+raw_mat = raw_cmp[["raw_Y", "raw_N", "raw_A", "raw_T"]].to_numpy()
+ann_mat = ann_cmp[["Yes", "No", "Abstain", "Total"]].to_numpy(dtype=int)
+bad = (raw_mat != ann_mat).any(axis=1)
+cmp = pd.DataFrame({"Country": ann_cmp["Country"].to_numpy()})
+for k, code in enumerate("YNAT"):
+    cmp[f"raw_{code}"] = raw_mat[:, k]
+    cmp[f"ann_{code}"] = ann_mat[:, k]
+mismatches = cmp[bad].to_dict("records")
 
 if len(mismatches) == 0:
     print("✓ ALL country vote counts match between un_votes_raw and annual_scores")
@@ -194,40 +203,41 @@ else:
     issues.append(f"{len(mismatches)} countries have vote count mismatches between raw and annual")
 
 # 2b. Countries in raw that are NOT in annual_scores
-raw_countries = set(country_cols)
-ann_countries = set(df_ann["Country"].tolist())
-in_raw_not_ann = raw_countries - ann_countries
-in_ann_not_raw = ann_countries - raw_countries
+# np.setdiff1d works on the arrays directly and returns sorted, unique codes
+raw_countries = np.asarray(country_cols, dtype=object)
+ann_countries = df_ann["Country"].to_numpy(dtype=object)
+in_raw_not_ann = np.setdiff1d(raw_countries, ann_countries).tolist()
+in_ann_not_raw = np.setdiff1d(ann_countries, raw_countries).tolist()
 if in_raw_not_ann:
-    print(f"\n⚠️  Countries in un_votes_raw columns but NOT in annual_scores 2025: {sorted(in_raw_not_ann)}")
-    # Check if they have any votes
-    for iso in sorted(in_raw_not_ann):
-        votes = df_raw[iso]
-        yes_n = (votes == "YES").sum()
-        no_n = (votes == "NO").sum()
-        abs_n = (votes == "ABSTAIN").sum()
-        null_n = votes.isna().sum()
+    print(f"\n⚠️  Countries in un_votes_raw columns but NOT in annual_scores 2025: {in_raw_not_ann}")
+    # Check if they have any votes (the Y/N/A tallies are already in raw_counts)
+    for iso in in_raw_not_ann:
+        yes_n, no_n, abs_n = raw_counts.loc[iso, ["raw_Y", "raw_N", "raw_A"]]
+        null_n = df_raw[iso].isna().sum()
         print(f"    {iso}: YES={yes_n} NO={no_n} ABS={abs_n} null={null_n}")
 if in_ann_not_raw:
-    print(f"\n⚠️  Countries in annual_scores but NOT in un_votes_raw: {sorted(in_ann_not_raw)}")
+    print(f"\n⚠️  Countries in annual_scores but NOT in un_votes_raw: {in_ann_not_raw}")
 
 # 2c. Raw aggregate columns — do they match per-country sums?
 print("\n--- Checking raw aggregate columns vs per-country sums ---")
-for _, res in df_raw.iterrows():
-    title = str(res.get("Title", ""))[:60]
-    reported_yes = int(res.get("YES COUNT", 0) or 0)
-    reported_no = int(res.get("NO COUNT", 0) or 0)
-    reported_abs = int(res.get("ABSTAIN COUNT", 0) or 0)
-    reported_total = int(res.get("TOTAL VOTES", 0) or 0)
-
-    actual_yes = sum(1 for c in country_cols if res.get(c) == "YES")
-    actual_no = sum(1 for c in country_cols if res.get(c) == "NO")
-    actual_abs = sum(1 for c in country_cols if res.get(c) == "ABSTAIN")
-    actual_total = actual_yes + actual_no + actual_abs
-
-    if (reported_yes != actual_yes or reported_no != actual_no
-        or reported_abs != actual_abs or reported_total != actual_total):
-        mismatches.append(title)
+def reported_count(col):
+    """Aggregate column as ints, blanks / nulls counted as 0 (like int(v or 0))."""
+    if col not in df_raw:
+        return 0
+    return pd.to_numeric(df_raw[col], errors="coerce").fillna(0).astype(int)
+
+# Row-wise sums over the same country block used in 2a
+actual_yes = pd.Series(is_yes.sum(axis=1), index=df_raw.index)
+actual_no = pd.Series(is_no.sum(axis=1), index=df_raw.index)
+actual_abs = pd.Series(is_abs.sum(axis=1), index=df_raw.index)
+actual_total = actual_yes + actual_no + actual_abs
+
+agg_bad = ((reported_count("YES COUNT") != actual_yes)
+           | (reported_count("NO COUNT") != actual_no)
+           | (reported_count("ABSTAIN COUNT") != actual_abs)
+           | (reported_count("TOTAL VOTES") != actual_total))
+titles = df_raw["Title"].astype(str).str[:60] if "Title" in df_raw else pd.Series("", index=df_raw.index)
+mismatches.extend(titles[agg_bad].tolist())
 
 if len(mismatches) == 0:
     print("✓ All resolution aggregate counts match per-country vote sums")
@@ -246,7 +256,8 @@ pw_rows = query_supabase("pairwise_similarity_yearly",
     params={"Year": "eq.2025"}, limit=50000)
 df_pw = pd.DataFrame(pw_rows)
 df_pw["CosineSimilarity"] = pd.to_numeric(df_pw["CosineSimilarity"], errors="coerce")
-pw_countries = set(df_pw["Country1_ISO3"]) | set(df_pw["Country2_ISO3"])
+pw_countries = np.union1d(df_pw["Country1_ISO3"].to_numpy(dtype=object),
+                          df_pw["Country2_ISO3"].to_numpy(dtype=object))
 n_pw = len(pw_countries)
 expected_pairs = n_pw * (n_pw - 1) // 2
 print(f"Countries in pairwise: {n_pw}")
@@ -258,6 +269,23 @@ else:
     print(f"❌ Pair count mismatch: got {len(df_pw)}, expected {expected_pairs}")
     issues.append(f"pairwise: pair count {len(df_pw)} != expected {expected_pairs}")
 
+# A right total can still hide a pair stored twice (both orientations) next to
+# one that is missing, so key every row by its unordered pair of country codes
+# and count exactly how many rows each pair has
+code1 = np.searchsorted(pw_countries, df_pw["Country1_ISO3"].to_numpy(dtype=object))
+code2 = np.searchsorted(pw_countries, df_pw["Country2_ISO3"].to_numpy(dtype=object))
+pair_keys = np.minimum(code1, code2) * n_pw + np.maximum(code1, code2)
+dup_keys, dup_counts = np.unique(pair_keys, return_counts=True)
+dup_keys = dup_keys[dup_counts > 1]
+if len(dup_keys) == 0:
+    print("✓ Every unordered pair appears once")
+    passes.append("pairwise: no duplicate unordered pairs")
+else:
+    shown = ", ".join(f"{pw_countries[k // n_pw]}-{pw_countries[k % n_pw]}"
+                      for k in dup_keys[:5])
+    print(f"❌ {len(dup_keys)} unordered pairs stored more than once (e.g. {shown})")
+    issues.append(f"pairwise: {len(dup_keys)} duplicate unordered pairs")
+
 # 3b. Range check
 sim_min = df_pw["CosineSimilarity"].min()
 sim_max = df_pw["CosineSimilarity"].max()
@@ -272,19 +300,15 @@ else:
 # 3c. Spot-check: recompute cosine similarity for a few pairs from raw votes
 print("\n--- Spot-check: recomputing cosine similarity from un_votes_raw ---")
 
-def vote_to_num(v):
-    if v == "YES": return 1
-    if v == "NO": return -1
-    if v == "ABSTAIN": return 0
-    return None  # no vote
+VOTE_TO_NUM = {"YES": 1.0, "NO": -1.0, "ABSTAIN": 0.0}  # anything else: no vote (NaN)
 
 def cosine_sim(v1, v2):
-    """Cosine similarity for two vote vectors, excluding positions where either is null."""
-    pairs = [(a, b) for a, b in zip(v1, v2) if a is not None and b is not None]
-    if not pairs:
+    """Cosine similarity for two vote vectors, excluding positions where either is NaN."""
+    both = ~(np.isnan(v1) | np.isnan(v2))
+    if not both.any():
         return 0.0
-    a_arr = np.array([p[0] for p in pairs], dtype=float)
-    b_arr = np.array([p[1] for p in pairs], dtype=float)
+    a_arr = v1[both]
+    b_arr = v2[both]
     dot = np.dot(a_arr, b_arr)
     norm_a = np.linalg.norm(a_arr)
     norm_b = np.linalg.norm(b_arr)
@@ -294,20 +318,25 @@ def cosine_sim(v1, v2):
 
 test_pairs = [("USA", "GBR"), ("USA", "ISR"), ("USA", "CUB"), ("BRA", "IND"),
               ("CHN", "RUS"), ("FRA", "DEU"), ("ARG", "ISR")]
+# Encode each test country's votes once as a float array (NaN = no vote) rather
+# than re-encoding both columns vote by vote for every pair they appear in. The
+# distinct test countries are intersected with the column list in one set
+# operation, so USA / ISR are encoded once and no membership test scans the list
+test_isos = {iso for pair in test_pairs for iso in pair}
+encoded = {iso: df_raw[iso].map(VOTE_TO_NUM).to_numpy(dtype=float)
+           for iso in test_isos.intersection(country_cols)}
 cos_match = 0
 cos_total = 0
+pw_by_pair = stored_similarity_by_pair(df_pw)
 for c1, c2 in test_pairs:
-    if c1 not in country_cols or c2 not in country_cols:
+    if c1 not in encoded or c2 not in encoded:
         continue
-    v1 = [vote_to_num(x) for x in df_raw[c1]]
-    v2 = [vote_to_num(x) for x in df_raw[c2]]
-    computed = cosine_sim(v1, v2)
+    computed = cosine_sim(encoded[c1], encoded[c2])
 
     # Find in pairwise table
-    pw_row = df_pw[((df_pw["Country1_ISO3"] == c1) & (df_pw["Country2_ISO3"] == c2)) |
-                   ((df_pw["Country1_ISO3"] == c2) & (df_pw["Country2_ISO3"] == c1))]
-    if len(pw_row) > 0:
-        stored = pw_row.iloc[0]["CosineSimilarity"]
+    pair = (min(c1, c2), max(c1, c2))
+    if pair in pw_by_pair.index:
+        stored = pw_by_pair.loc[pair]
         diff = abs(computed - stored)
         status = "✓" if diff < 0.001 else f"❌ DIFF={diff:.4f}"
         print(f"  {c1}-{c2}: computed={computed:.6f}  stored={stored:.6f}  {status}")
@@ -348,11 +377,14 @@ df_hist = pd.DataFrame(hist)
 df_hist.columns = ["Year", "P1"]
 df_hist["P1"] = pd.to_numeric(df_hist["P1"], errors="coerce")
 
-for year in sorted(df_hist["Year"].unique()):
-    sub = df_hist[df_hist.Year == year]["P1"].dropna()
-    print(f"  {year}: n={len(sub)}, mean={sub.mean():.2f}, "
-          f"min={sub.min():.1f}, max={sub.max():.1f}, "
-          f"nulls={df_hist[(df_hist.Year==year)&(df_hist.P1.isna())].shape[0]}")
+# One groupby for every year's stats instead of two mask scans per year;
+# the null count is the group size minus its non-null count
+p1_by_year = df_hist.groupby("Year")["P1"].agg(
+    rows="size", n="count", mean="mean", min="min", max="max")
+for r in p1_by_year.itertuples():
+    print(f"  {r.Index}: n={r.n}, mean={r.mean:.2f}, "
+          f"min={r.min:.1f}, max={r.max:.1f}, "
+          f"nulls={r.rows - r.n}")
 
 # ══════════════════════════════════════════════════════════════════════════
 # TABLE 5: topic_votes_yearly — can we use it or must we bypass?
@@ -373,16 +405,18 @@ print(f"Unique countries: {df_tv_dedup['Country'].nunique()}")
 
 # Check: does deduped data have correct vote counts?
 # Pick a country and compare topic sums to annual_scores
+tv_vote_cols = ["YesVotes_Topic", "NoVotes_Topic", "AbstainVotes_Topic", "TotalVotes_Topic"]
+tv_sums = (df_tv_dedup[tv_vote_cols].apply(pd.to_numeric, errors="coerce")
+           .groupby(df_tv_dedup["Country"]).sum())
+ann_by_country = df_ann.drop_duplicates(subset=["Country"]).set_index("Country")
 for iso in ["USA", "BRA", "GBR", "ARG"]:
-    tv_sub = df_tv_dedup[df_tv_dedup["Country"] == iso]
-    for c in ["YesVotes_Topic", "NoVotes_Topic", "AbstainVotes_Topic", "TotalVotes_Topic"]:
-        tv_sub[c] = pd.to_numeric(tv_sub[c], errors="coerce")
-    tv_yes = tv_sub["YesVotes_Topic"].sum()
-    tv_total = tv_sub["TotalVotes_Topic"].sum()
+    has_tv = iso in tv_sums.index
+    tv_yes = tv_sums.at[iso, "YesVotes_Topic"] if has_tv else 0
+    tv_total = tv_sums.at[iso, "TotalVotes_Topic"] if has_tv else 0
 
-    ann_row = df_ann[df_ann["Country"] == iso]
-    ann_yes = int(ann_row["Yes"].iloc[0]) if len(ann_row) > 0 else 0
-    ann_total = int(ann_row["Total"].iloc[0]) if len(ann_row) > 0 else 0
+    has_ann = iso in ann_by_country.index
+    ann_yes = int(ann_by_country.at[iso, "Yes"]) if has_ann else 0
+    ann_total = int(ann_by_country.at[iso, "Total"]) if has_ann else 0
 
     # With multi-tagging, topic sums should be >= annual totals
     # But we know only 29/268 tags survive, so it'll be lower
@@ -398,11 +432,11 @@ separator("TABLE 6: Can we bypass topic_votes and compute from un_votes_raw?")
 # Check tag quality in raw
 tag_counts = Counter()
 null_tags = 0
-for _, r in df_raw.iterrows():
-    if pd.isna(r.get("tags")):
+for raw_tags in df_raw["tags"]:
+    if pd.isna(raw_tags):
         null_tags += 1
         continue
-    t = str(r["tags"])
+    t = str(raw_tags)
     try:
         tl = ast.literal_eval(t)
         if isinstance(tl, list):
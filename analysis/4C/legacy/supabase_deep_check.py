@@ -8,6 +8,7 @@ from pathlib import Path
 from dotenv import load_dotenv
 import pandas as pd
 import numpy as np
+from pairwise_lookup import stored_similarity_by_pair
 
 env_path = Path(__file__).parent.parent.parent / ".env"
 load_dotenv(env_path)
@@ -73,22 +74,33 @@ for c in ["Yes", "No", "Abstain", "Total"]:
     df_ann[c] = pd.to_numeric(df_ann[c], errors="coerce")
 
 # Check how many countries have 193 votes in raw (voted on all resolutions)
-votes_per_country = {}
-for col in country_cols:
-    voted = df_raw[col].notna() & (df_raw[col] != "")
-    voted_count = voted.sum()
-    yes_c = (df_raw[col] == "YES").sum()
-    no_c = (df_raw[col] == "NO").sum()
-    abs_c = (df_raw[col] == "ABSTAIN").sum()
-    total_c = yes_c + no_c + abs_c
-    votes_per_country[col] = {"voted": voted_count, "Y": yes_c, "N": no_c, "A": abs_c, "total": total_c}
-
-# Countries that voted on all 193
-voted_all = {c: v for c, v in votes_per_country.items() if v["total"] == 193}
+# Column-wise counts over the whole country block rather than four scans per country
+block = df_raw[country_cols]
+# Y/N/A come from one integer encoding of the block (0=YES, 1=NO, 2=ABSTAIN,
+# -1 otherwise) instead of three more string compares over every cell
+vote_codes = pd.Index(["YES", "NO", "ABSTAIN"]).get_indexer(
+    block.to_numpy().ravel()).reshape(block.shape)
+votes_per_country = pd.DataFrame({
+    "voted": (block.notna() & (block != "")).sum(),
+    "Y": (vote_codes == 0).sum(axis=0),
+    "N": (vote_codes == 1).sum(axis=0),
+    "A": (vote_codes == 2).sum(axis=0),
+})
+votes_per_country["total"] = votes_per_country["Y"] + votes_per_country["N"] + votes_per_country["A"]
+
+# Countries that voted on all 193, joined to annual_scores on ISO3 in one step.
+# The per-country lookups took the first annual_scores row for a country, so
+# repeated Country rows are dropped (keeping the first) before indexing on it.
+ann_dupes = int(df_ann["Country"].duplicated().sum())
+if ann_dupes:
+    print(f"\nannual_scores 2025 rows with a repeated Country (first kept): {ann_dupes}")
+ann_by_iso = df_ann.drop_duplicates("Country").set_index("Country")
+voted_all = (votes_per_country[votes_per_country["total"] == 193]
+             .join(ann_by_iso["Total"].rename("ann_total"), how="left")
+             .sort_index())
 print(f"\nCountries that voted on all 193 resolutions: {len(voted_all)}")
-for c in sorted(voted_all):
-    ann_row = df_ann[df_ann["Country"] == c]
-    ann_total = int(ann_row["Total"].iloc[0]) if len(ann_row) > 0 else "N/A"
+for c, ann_total in voted_all["ann_total"].items():
+    ann_total = int(ann_total) if pd.notna(ann_total) else "N/A"
     print(f"  {c}: raw_total=193, annual_total={ann_total}")
 
 # For countries with mismatch, find which specific resolution(s) differ
@@ -99,13 +111,12 @@ print("\n--- Identifying the mystery resolution ---")
 # (b) the vote is counted differently
 
 # Let's check: which resolution has the fewest non-null votes?
-df_raw["nonull_count"] = df_raw[country_cols].apply(
-    lambda row: sum(1 for v in row if pd.notna(v) and v in ("YES", "NO", "ABSTAIN")), axis=1)
-df_raw_sorted = df_raw.sort_values("nonull_count")
+# (isin hashes the three vote codes once and tests the whole block in C)
+df_raw["nonull_count"] = block.isin(("YES", "NO", "ABSTAIN")).sum(axis=1)
 print(f"\nResolution with fewest voters:")
-for _, r in df_raw_sorted.head(5).iterrows():
-    print(f"  {r['Resolution']:20s} voters={r['nonull_count']}  date={str(r.get('Date',''))[:10]}  "
-          f"title={str(r.get('Title',''))[:70]}")
+for r in df_raw.nsmallest(5, "nonull_count").itertuples(index=False):
+    print(f"  {r.Resolution:20s} voters={r.nonull_count}  date={str(getattr(r, 'Date', ''))[:10]}  "
+          f"title={str(getattr(r, 'Title', ''))[:70]}")
 
 # Check: is there a resolution where annual_scores max Total is 192 
 # but raw has 193 total resolutions?
@@ -121,18 +132,16 @@ for _, r in df_raw_sorted.head(5).iterrows():
 print("\n--- CHN vote on each resolution ---")
 mismatched_countries = ["CHN", "RUS", "USA"]
 for iso in mismatched_countries:
-    ann_row = df_ann[df_ann["Country"] == iso]
-    if len(ann_row) == 0:
+    if iso not in ann_by_iso.index:
         continue
-    ann_yes = int(ann_row["Yes"].iloc[0])
-    ann_no = int(ann_row["No"].iloc[0])
-    ann_abs = int(ann_row["Abstain"].iloc[0])
-    ann_total = int(ann_row["Total"].iloc[0])
+    ann_row = ann_by_iso.loc[iso]
+    ann_yes = int(ann_row["Yes"])
+    ann_no = int(ann_row["No"])
+    ann_abs = int(ann_row["Abstain"])
+    ann_total = int(ann_row["Total"])
     
-    raw_yes = (df_raw[iso] == "YES").sum()
-    raw_no = (df_raw[iso] == "NO").sum()
-    raw_abs = (df_raw[iso] == "ABSTAIN").sum()
-    raw_total = raw_yes + raw_no + raw_abs
+    # Raw tallies come from the column-wise votes_per_country counts above
+    raw_yes, raw_no, raw_abs, raw_total = votes_per_country.loc[iso, ["Y", "N", "A", "total"]]
     
     diff_yes = raw_yes - ann_yes
     diff_no = raw_no - ann_no
@@ -154,35 +163,31 @@ for iso in mismatched_countries:
 print("\n--- Finding the excluded resolution ---")
 # For each of the 193 resolutions, remove it and check if counts match
 for iso in mismatched_countries:
-    ann_row = df_ann[df_ann["Country"] == iso]
-    ann_yes = int(ann_row["Yes"].iloc[0])
-    ann_no = int(ann_row["No"].iloc[0])
-    ann_abs = int(ann_row["Abstain"].iloc[0])
-    
-    found = []
-    for idx, r in df_raw.iterrows():
-        vote = r[iso]
-        # If we exclude this resolution, do counts match?
-        raw_yes = (df_raw[iso] == "YES").sum()
-        raw_no = (df_raw[iso] == "NO").sum()
-        raw_abs = (df_raw[iso] == "ABSTAIN").sum()
-        
-        if vote == "YES":
-            test_yes, test_no, test_abs = raw_yes - 1, raw_no, raw_abs
-        elif vote == "NO":
-            test_yes, test_no, test_abs = raw_yes, raw_no - 1, raw_abs
-        elif vote == "ABSTAIN":
-            test_yes, test_no, test_abs = raw_yes, raw_no, raw_abs - 1
-        else:
-            continue
-        
-        if test_yes == ann_yes and test_no == ann_no and test_abs == ann_abs:
-            found.append({
-                "Resolution": r.get("Resolution", ""),
-                "Title": str(r.get("Title", ""))[:70],
-                "Date": str(r.get("Date", ""))[:10],
-                "Vote": vote,
-            })
+    ann_row = ann_by_iso.loc[iso]
+    ann_yes = int(ann_row["Yes"])
+    ann_no = int(ann_row["No"])
+    ann_abs = int(ann_row["Abstain"])
+
+    # Excluding a single resolution only changes the tally of the vote cast on
+    # it, so a vote value qualifies when its raw tally is exactly one above
+    # annual and the other two tallies already match.
+    votes = df_raw[iso]
+    raw_counts = {v: int(votes_per_country.at[iso, code])
+                  for v, code in (("YES", "Y"), ("NO", "N"), ("ABSTAIN", "A"))}
+    ann_counts = {"YES": ann_yes, "NO": ann_no, "ABSTAIN": ann_abs}
+    excludable = [
+        v for v in raw_counts
+        if raw_counts[v] - ann_counts[v] == 1
+        and all(raw_counts[o] == ann_counts[o] for o in raw_counts if o != v)
+    ]
+    hits = df_raw[votes.isin(excludable)]
+    found = [{
+        "Resolution": res,
+        "Title": str(title)[:70],
+        "Date": str(date)[:10],
+        "Vote": vote,
+    } for res, title, date, vote in zip(
+        hits["Resolution"], hits["Title"], hits["Date"], hits[iso])]
     
     if found:
         print(f"\n  {iso}: Excluding any of these {len(found)} resolution(s) matches annual_scores:")
@@ -210,9 +215,6 @@ def vote_to_num(v):
 # Let's test multiple encodings
 print("\nTesting different vote encodings for USA-GBR pair:")
 
-usa_raw = [df_raw.iloc[i]["USA"] for i in range(len(df_raw))]
-gbr_raw = [df_raw.iloc[i]["GBR"] for i in range(len(df_raw))]
-
 # Get stored value
 pw_data = query_supabase("pairwise_similarity_yearly",
     select="CosineSimilarity",
@@ -247,15 +249,20 @@ def compute_cosine(c1_votes, c2_votes, encode_fn, include_null=False, null_val=0
         return 0
     return dot / (n1 * n2)
 
-enc_a = lambda v: {  "YES": 1, "NO": -1, "ABSTAIN": 0}.get(v, None)
-enc_b = lambda v: {"YES": 1, "NO": 0, "ABSTAIN": 0.5}.get(v, None)
-enc_c = lambda v: {"YES": 1, "NO": -1, "ABSTAIN": 0.5}.get(v, None)
-enc_d = lambda v: {"YES": 1, "NO": 0, "ABSTAIN": 0}.get(v, None)
+# Each encoding is the bound .get of a dict built once, rather than a lambda
+# that rebuilds its dict literal for every vote it encodes
+enc_a = {"YES": 1, "NO": -1, "ABSTAIN": 0}.get
+enc_b = {"YES": 1, "NO": 0, "ABSTAIN": 0.5}.get
+enc_c = {"YES": 1, "NO": -1, "ABSTAIN": 0.5}.get
+enc_d = {"YES": 1, "NO": 0, "ABSTAIN": 0}.get
 
 test_pairs = [
     ("USA", "GBR"), ("USA", "ISR"), ("USA", "CUB"),
     ("BRA", "IND"), ("CHN", "RUS"), ("FRA", "DEU")
 ]
+# Each test country's 2025 votes, pulled out of df_raw once as a plain list
+# instead of one df_raw.iloc row lookup per resolution in every check below
+votes_by_country = {iso: df_raw[iso].tolist() for pair in test_pairs for iso in pair}
 
 # Get all stored values
 stored_vals = {}
@@ -271,10 +278,10 @@ pw_all = query_supabase("pairwise_similarity_yearly",
 df_pw = pd.DataFrame(pw_all)
 df_pw["CosineSimilarity"] = pd.to_numeric(df_pw["CosineSimilarity"], errors="coerce")
 
+pw_by_pair = stored_similarity_by_pair(df_pw)
 for c1, c2 in test_pairs:
-    row = df_pw[((df_pw["Country1_ISO3"]==c1)&(df_pw["Country2_ISO3"]==c2)) |
-                ((df_pw["Country1_ISO3"]==c2)&(df_pw["Country2_ISO3"]==c1))]
-    stored_vals[(c1,c2)] = float(row.iloc[0]["CosineSimilarity"]) if len(row) > 0 else None
+    pair = (min(c1, c2), max(c1, c2))
+    stored_vals[(c1,c2)] = float(pw_by_pair.loc[pair]) if pair in pw_by_pair.index else None
 
 encodings = {
     "YES=1 NO=-1 ABS=0 null=skip": (enc_a, False, 0),
@@ -295,8 +302,8 @@ for enc_name, (enc_fn, inc_null, null_v) in encodings.items():
     diffs = []
     print(f"{enc_name:<40s}", end="")
     for c1, c2 in test_pairs:
-        v1 = [df_raw.iloc[i][c1] for i in range(len(df_raw))]
-        v2 = [df_raw.iloc[i][c2] for i in range(len(df_raw))]
+        v1 = votes_by_country[c1]
+        v2 = votes_by_country[c2]
         computed = compute_cosine(v1, v2, enc_fn, inc_null, null_v)
         stored = stored_vals.get((c1, c2))
         if stored is not None:
@@ -331,11 +338,11 @@ for n_exclude in [0, 1]:
 # Final hypothesis: maybe they exclude ABSTAIN from the vector entirely
 # (treat it like null/no-vote)
 print("\nTrying: ABSTAIN treated as non-vote (excluded)")
-enc_noabs = lambda v: {"YES": 1, "NO": -1}.get(v, None)
+enc_noabs = {"YES": 1, "NO": -1}.get
 diffs = []
 for c1, c2 in test_pairs:
-    v1 = [df_raw.iloc[i][c1] for i in range(len(df_raw))]
-    v2 = [df_raw.iloc[i][c2] for i in range(len(df_raw))]
+    v1 = votes_by_country[c1]
+    v2 = votes_by_country[c2]
     computed = compute_cosine(v1, v2, enc_noabs, False, 0)
     stored = stored_vals.get((c1, c2))
     if stored is not None:
@@ -347,11 +354,13 @@ print(f"  Avg diff: {np.mean(diffs):.4f}")
 # What if they use YES=1, NO=-1 and ABSTAIN as a SEPARATE dimension?
 # i.e., 3D vector per resolution: (yes, no, abstain)
 print("\nTrying: 3D one-hot encoding (YES=[1,0,0] NO=[0,1,0] ABS=[0,0,1] null=excluded)")
+ONE_HOT = {"YES": (1,0,0), "NO": (0,1,0), "ABSTAIN": (0,0,1)}
+
 def compute_cosine_3d(c1_votes, c2_votes):
     v1, v2 = [], []
     for a, b in zip(c1_votes, c2_votes):
-        a_enc = {"YES": [1,0,0], "NO": [0,1,0], "ABSTAIN": [0,0,1]}.get(a)
-        b_enc = {"YES": [1,0,0], "NO": [0,1,0], "ABSTAIN": [0,0,1]}.get(b)
+        a_enc = ONE_HOT.get(a)
+        b_enc = ONE_HOT.get(b)
         if a_enc is None or b_enc is None:
             continue
         v1.extend(a_enc)
@@ -367,8 +376,8 @@ def compute_cosine_3d(c1_votes, c2_votes):
 
 diffs = []
 for c1, c2 in test_pairs:
-    v1 = [df_raw.iloc[i][c1] for i in range(len(df_raw))]
-    v2 = [df_raw.iloc[i][c2] for i in range(len(df_raw))]
+    v1 = votes_by_country[c1]
+    v2 = votes_by_country[c2]
     computed = compute_cosine_3d(v1, v2)
     stored = stored_vals.get((c1, c2))
     if stored is not None:
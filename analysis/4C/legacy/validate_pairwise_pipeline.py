@@ -78,7 +78,8 @@ df_filtered.dropna(subset=['Date'], inplace=True)
 df_filtered['Year'] = df_filtered['Date'].dt.year
 
 # How many GA resolutions in 2025?
-df_2025 = df_filtered[df_filtered['Year'] == 2025].copy()
+# Only read from here on, so a plain boolean slice is enough (no .copy())
+df_2025 = df_filtered[df_filtered['Year'] == 2025]
 print(f"GA resolutions in 2025: {len(df_2025)}")
 
 # Also load from un_votes_raw for comparison
@@ -137,24 +138,48 @@ def map_vote(vote):
     if vote_str == 'NO': return -1
     return 0
 
+def encode_votes(block):
+    """block.apply(lambda col: col.map(map_vote)) as an int8 frame, decoded once per value.
+
+    A vote block only ever holds a handful of distinct cells (YES / NO /
+    ABSTAIN, blanks, nulls), so factorize it, run map_vote over the distinct
+    values to build a small int8 lookup table and gather the whole matrix
+    from it in one step. Nulls factorize to -1, which hits the trailing 0.
+    """
+    labels, uniques = pd.factorize(block.to_numpy().ravel())
+    table = np.array([map_vote(v) for v in uniques] + [0], dtype=np.int8)
+    return pd.DataFrame(table[labels].reshape(block.shape),
+                        index=block.index, columns=block.columns)
+
+def upper_pairs(sim, labels):
+    """Long (Country1, Country2, sim) rows with Country1 < Country2.
+
+    Same rows, in the same order, as stacking the labelled square frame and
+    filtering Country1 < Country2, but the pair mask is built on the label
+    array and only the kept cells are gathered from the matrix.
+    """
+    labels = np.asarray(labels, dtype=object)
+    i, j = np.nonzero(labels[:, None] < labels[None, :])
+    return pd.DataFrame({'Country1_ISO3': labels[i], 'Country2_ISO3': labels[j],
+                         'CosineSimilarity': sim[i, j]})
+
 # Use un_votes_with_sc data (pipeline source) for 2025
 country_cols = country_cols_sc
 df_year = df_2025[country_cols]
 print(f"Vote matrix shape (resolutions x countries): {df_year.shape}")
 
 # Apply exact pipeline encoding
-vote_matrix_numeric = df_year.apply(lambda col: col.map(map_vote)).fillna(0).astype(np.int8)
+vote_matrix_numeric = encode_votes(df_year)
 print(f"Numeric matrix shape: {vote_matrix_numeric.shape}")
-print(f"Unique values: {sorted(vote_matrix_numeric.stack().unique())}")
+# np.unique over the raw int8 block returns the sorted distinct codes directly,
+# without stacking the matrix into a resolutions x countries long Series first
+print(f"Unique values: {np.unique(vote_matrix_numeric.to_numpy()).tolist()}")
 
 # Compute cosine similarity (exact pipeline method)
 similarity_matrix = cosine_similarity(vote_matrix_numeric.T)
-df_sim = pd.DataFrame(similarity_matrix, index=country_cols, columns=country_cols)
 
 # Convert to long format with Country1 < Country2 (exact pipeline logic)
-df_sim_long = df_sim.stack().reset_index()
-df_sim_long.columns = ['Country1_ISO3', 'Country2_ISO3', 'CosineSimilarity']
-df_sim_long = df_sim_long[df_sim_long['Country1_ISO3'] < df_sim_long['Country2_ISO3']]
+df_sim_long = upper_pairs(similarity_matrix, country_cols)
 print(f"Computed pairs: {len(df_sim_long)}")
 
 # ══════════════════════════════════════════════════════════════════════════
@@ -170,39 +195,59 @@ df_stored = pd.DataFrame(stored_rows)
 df_stored["CosineSimilarity"] = pd.to_numeric(df_stored["CosineSimilarity"], errors="coerce")
 print(f"Stored pairs: {len(df_stored)}")
 
-# Merge on country pair
-df_compare = pd.merge(
-    df_sim_long, df_stored,
-    on=["Country1_ISO3", "Country2_ISO3"],
-    suffixes=("_computed", "_stored"),
-    how="outer"
-)
-print(f"Merged pairs: {len(df_compare)}")
-print(f"Only in computed: {df_compare['CosineSimilarity_stored'].isna().sum()}")
-print(f"Only in stored: {df_compare['CosineSimilarity_computed'].isna().sum()}")
+# Inner-join on country pair (sorted by pair, as the outer join was) and count
+# the unmatched pairs from the key sets, instead of materialising the full
+# outer frame only to count its NaNs and drop them again
+pair_keys = ["Country1_ISO3", "Country2_ISO3"]
+computed_in_stored = pd.MultiIndex.from_frame(df_sim_long[pair_keys]).isin(
+    pd.MultiIndex.from_frame(df_stored[pair_keys]))
+stored_in_computed = pd.MultiIndex.from_frame(df_stored[pair_keys]).isin(
+    pd.MultiIndex.from_frame(df_sim_long[pair_keys]))
+computed_only = df_sim_long.loc[~computed_in_stored, "CosineSimilarity"]
+stored_only = df_stored.loc[~stored_in_computed, "CosineSimilarity"]
+matched = pd.merge(df_sim_long, df_stored, on=pair_keys,
+                   suffixes=("_computed", "_stored"), sort=True)
+# A side's value is missing on the other side's unmatched rows and wherever it is NaN
+no_stored = (len(computed_only) + stored_only.isna().sum()
+             + matched["CosineSimilarity_stored"].isna().sum())
+no_computed = (len(stored_only) + computed_only.isna().sum()
+               + matched["CosineSimilarity_computed"].isna().sum())
+print(f"Merged pairs: {len(matched) + len(computed_only) + len(stored_only)}")
+print(f"Only in computed: {no_stored}")
+print(f"Only in stored: {no_computed}")
 
 # Calculate differences
-both = df_compare.dropna(subset=["CosineSimilarity_computed", "CosineSimilarity_stored"])
+both = matched.dropna(subset=["CosineSimilarity_computed", "CosineSimilarity_stored"])
 both["diff"] = abs(both["CosineSimilarity_computed"] - both["CosineSimilarity_stored"])
 print(f"\nPairs in both: {len(both)}")
-print(f"Mean absolute diff: {both['diff'].mean():.6f}")
-print(f"Max absolute diff: {both['diff'].max():.6f}")
-print(f"Median absolute diff: {both['diff'].median():.6f}")
-print(f"Pairs with diff < 0.0001: {(both['diff'] < 0.0001).sum()} ({(both['diff'] < 0.0001).mean()*100:.1f}%)")
-print(f"Pairs with diff < 0.001: {(both['diff'] < 0.001).sum()} ({(both['diff'] < 0.001).mean()*100:.1f}%)")
-print(f"Pairs with diff < 0.01: {(both['diff'] < 0.01).sum()} ({(both['diff'] < 0.01).mean()*100:.1f}%)")
-print(f"Pairs with diff > 0.1: {(both['diff'] > 0.1).sum()}")
+# One sort of the diffs answers the max, the median and every threshold count
+# (a searchsorted each) instead of a fresh scan per statistic; the mean is
+# taken once and reused by step 6's test
+diffs = np.sort(both["diff"].to_numpy())
+n_diffs = len(diffs)
+mean_diff = both["diff"].mean()
+n_over = lambda tol: n_diffs - np.searchsorted(diffs, tol, side="right")
+print(f"Mean absolute diff: {mean_diff:.6f}")
+print(f"Max absolute diff: {diffs[-1] if n_diffs else np.nan:.6f}")
+print(f"Median absolute diff: {np.median(diffs) if n_diffs else np.nan:.6f}")
+for tol in (0.0001, 0.001, 0.01):
+    n_close = np.searchsorted(diffs, tol)
+    print(f"Pairs with diff < {tol}: {n_close} ({np.float64(n_close) / n_diffs * 100:.1f}%)")
+print(f"Pairs with diff > 0.1: {n_over(0.1)}")
 
 # Spot-check specific pairs
 spot_pairs = [("GBR", "USA"), ("ISR", "USA"), ("CUB", "USA"),
               ("BRA", "IND"), ("CHN", "RUS"), ("DEU", "FRA"), ("ARG", "ISR")]
 print("\nSpot-check pairs:")
+# Index the merged pairs once (first row per pair, as .iloc[0] took) so each
+# spot check is a hash lookup instead of two string-column scans
+by_pair = (both.drop_duplicates(subset=["Country1_ISO3", "Country2_ISO3"])
+           .set_index(["Country1_ISO3", "Country2_ISO3"]))
 for c1, c2 in spot_pairs:
     # Ensure c1 < c2 for lookup
     a, b = min(c1, c2), max(c1, c2)
-    row = both[(both["Country1_ISO3"] == a) & (both["Country2_ISO3"] == b)]
-    if len(row) > 0:
-        r = row.iloc[0]
+    if (a, b) in by_pair.index:
+        r = by_pair.loc[(a, b)]
         status = "✓" if r["diff"] < 0.001 else f"❌ DIFF={r['diff']:.6f}"
         print(f"  {c1}-{c2}: computed={r['CosineSimilarity_computed']:.6f}  "
               f"stored={r['CosineSimilarity_stored']:.6f}  {status}")
@@ -210,67 +255,42 @@ for c1, c2 in spot_pairs:
         print(f"  {c1}-{c2}: NOT FOUND in merged data")
 
 # Show worst mismatches
-if (both["diff"] > 0.001).any():
+if n_over(0.001) > 0:
     print("\nWorst mismatches (top 10):")
     worst = both.nlargest(10, "diff")
-    for _, r in worst.iterrows():
-        print(f"  {r['Country1_ISO3']}-{r['Country2_ISO3']}: "
-              f"computed={r['CosineSimilarity_computed']:.6f}  "
-              f"stored={r['CosineSimilarity_stored']:.6f}  "
-              f"diff={r['diff']:.6f}")
+    for r in worst.itertuples(index=False):
+        print(f"  {r.Country1_ISO3}-{r.Country2_ISO3}: "
+              f"computed={r.CosineSimilarity_computed:.6f}  "
+              f"stored={r.CosineSimilarity_stored:.6f}  "
+              f"diff={r.diff:.6f}")
 
 # ══════════════════════════════════════════════════════════════════════════
 # STEP 6: If mismatch, try with un_votes_raw instead
 # ══════════════════════════════════════════════════════════════════════════
-if both["diff"].mean() > 0.001:
+def report_stored_diffs(label, vote_block):
+    """Recompute similarity from vote_block and print how it compares with df_stored.
+
+    The |computed - stored| gaps stay one numpy array, and a single boolean
+    mask of the close pairs gives both the count and the share.
+    """
+    sim = cosine_similarity(encode_votes(vote_block).T)
+    cmp = pd.merge(upper_pairs(sim, vote_block.columns), df_stored, on=pair_keys,
+                   suffixes=("_computed", "_stored"), how="inner")
+    diff = np.abs(cmp["CosineSimilarity_computed"].to_numpy()
+                  - cmp["CosineSimilarity_stored"].to_numpy())
+    close = diff < 0.001
+    print(f"{label}: mean diff = {np.nanmean(diff):.6f}")
+    print(f"  Pairs with diff < 0.001: {close.sum()} ({close.mean()*100:.1f}%)")
+
+if mean_diff > 0.001:
     separator("6. Trying with un_votes_raw instead")
 
     country_cols_r = identify_country_columns(df_raw.columns)
-    df_year_raw = df_raw[country_cols_r]
-    vote_matrix_raw = df_year_raw.apply(lambda col: col.map(map_vote)).fillna(0).astype(np.int8)
-    sim_raw = cosine_similarity(vote_matrix_raw.T)
-    df_sim_raw = pd.DataFrame(sim_raw, index=country_cols_r, columns=country_cols_r)
-    df_sim_raw_long = df_sim_raw.stack().reset_index()
-    df_sim_raw_long.columns = ['Country1_ISO3', 'Country2_ISO3', 'CosineSimilarity']
-    df_sim_raw_long = df_sim_raw_long[
-        df_sim_raw_long['Country1_ISO3'] < df_sim_raw_long['Country2_ISO3']]
-
-    df_compare_raw = pd.merge(
-        df_sim_raw_long, df_stored,
-        on=["Country1_ISO3", "Country2_ISO3"],
-        suffixes=("_computed", "_stored"),
-        how="inner"
-    )
-    df_compare_raw["diff"] = abs(
-        df_compare_raw["CosineSimilarity_computed"] - df_compare_raw["CosineSimilarity_stored"])
-
-    print(f"Using un_votes_raw: mean diff = {df_compare_raw['diff'].mean():.6f}")
-    print(f"  Pairs with diff < 0.001: {(df_compare_raw['diff'] < 0.001).sum()} "
-          f"({(df_compare_raw['diff'] < 0.001).mean()*100:.1f}%)")
+    report_stored_diffs("Using un_votes_raw", df_raw[country_cols_r])
 
     # Also try excluding the test resolution
     df_raw_no_test = df_raw[df_raw['Resolution'] != 'A/RES/79/125']
-    df_year_nt = df_raw_no_test[country_cols_r]
-    vote_matrix_nt = df_year_nt.apply(lambda col: col.map(map_vote)).fillna(0).astype(np.int8)
-    sim_nt = cosine_similarity(vote_matrix_nt.T)
-    df_sim_nt = pd.DataFrame(sim_nt, index=country_cols_r, columns=country_cols_r)
-    df_sim_nt_long = df_sim_nt.stack().reset_index()
-    df_sim_nt_long.columns = ['Country1_ISO3', 'Country2_ISO3', 'CosineSimilarity']
-    df_sim_nt_long = df_sim_nt_long[
-        df_sim_nt_long['Country1_ISO3'] < df_sim_nt_long['Country2_ISO3']]
-
-    df_compare_nt = pd.merge(
-        df_sim_nt_long, df_stored,
-        on=["Country1_ISO3", "Country2_ISO3"],
-        suffixes=("_computed", "_stored"),
-        how="inner"
-    )
-    df_compare_nt["diff"] = abs(
-        df_compare_nt["CosineSimilarity_computed"] - df_compare_nt["CosineSimilarity_stored"])
-
-    print(f"\nExcluding test resolution: mean diff = {df_compare_nt['diff'].mean():.6f}")
-    print(f"  Pairs with diff < 0.001: {(df_compare_nt['diff'] < 0.001).sum()} "
-          f"({(df_compare_nt['diff'] < 0.001).mean()*100:.1f}%)")
+    report_stored_diffs("\nExcluding test resolution", df_raw_no_test[country_cols_r])
 
 # ══════════════════════════════════════════════════════════════════════════
 # STEP 7: Check if save_data_to_supabase rounds values
@@ -279,12 +299,12 @@ separator("7. Checking stored value precision")
 
 # Get sample stored values and check decimal places
 sample = df_stored.head(10)
-for _, r in sample.iterrows():
-    val = r["CosineSimilarity"]
+for r in sample.itertuples(index=False):
+    val = r.CosineSimilarity
     # Count significant decimal digits
     val_str = f"{val:.20f}".rstrip('0')
     dec_places = len(val_str.split('.')[-1]) if '.' in val_str else 0
-    print(f"  {r['Country1_ISO3']}-{r['Country2_ISO3']}: {val} ({dec_places} decimal digits)")
+    print(f"  {r.Country1_ISO3}-{r.Country2_ISO3}: {val} ({dec_places} decimal digits)")
 
 # The pipeline's save function rounds to 4 decimal places.
 # If stored values have >4 decimal places, the data was NOT saved through
@@ -27,6 +27,8 @@ Outputs (analysis/4C/):
   14_p1_alliance_pattern_shifts.csv   — Countries that moved toward/away from blocs
 """
 
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 import json
 import pandas as pd
 import numpy as np
@@ -35,6 +37,9 @@ from pathlib import Path
 # ── Paths ─────────────────────────────────────────────────────────────────
 DATA_DIR = Path(__file__).parent.parent.parent / "data"
 OUT_DIR = Path(__file__).parent
+CACHE_DIR = OUT_DIR / ".cache"
+# Rows per chunk when a CSV is streamed with a year filter (read_csv_cached)
+READ_CHUNK_ROWS = 50_000
 
 def separator(title):
     print(f"\n{'='*70}\n  {title}\n{'='*70}")
@@ -158,18 +163,217 @@ SUBREGION_TO_BROAD = {
     'Melanesia': 'Oceania', 'Micronesia': 'Oceania', 'Polynesia': 'Oceania',
 }
 
+# Both levels in one ISO3-indexed table, built once, so a column of ISO3 codes
+# resolves to sub-region + broad region with a single reindex gather
+REGION_TABLE = pd.DataFrame({'region': pd.Series(ISO3_TO_REGION)})
+REGION_TABLE['broad_region'] = REGION_TABLE['region'].map(SUBREGION_TO_BROAD)
+
+
+def region_lookup(iso3):
+    """(sub-region, broad region) arrays aligned with a Series of ISO3 codes.
+
+    A categorical column is resolved once per category and the result gathered
+    by its integer codes (a trailing NaN slot catches code -1), so only a few
+    hundred strings are hashed however long the column is.
+    """
+    if isinstance(iso3.dtype, pd.CategoricalDtype):
+        hit = REGION_TABLE.reindex(iso3.cat.categories)
+        codes = iso3.cat.codes.to_numpy()
+        return (np.append(hit['region'].to_numpy(), np.nan)[codes],
+                np.append(hit['broad_region'].to_numpy(), np.nan)[codes])
+    hit = REGION_TABLE.reindex(iso3.to_numpy())
+    return hit['region'].to_numpy(), hit['broad_region'].to_numpy()
+
+
+def with_regions(df, iso_col, region_col='region'):
+    """df plus region_col / broad_region looked up from iso_col, as a new frame."""
+    region, broad = region_lookup(df[iso_col])
+    return df.assign(**{region_col: region, 'broad_region': broad})
+
+
+def _smallest_positions(keyed, kth, k):
+    """Positions of the k smallest `keyed` values, given the k-th one, in order."""
+    # Everything strictly inside the k-th value, then ties at it in row order
+    below = np.flatnonzero(keyed < kth)
+    part = np.concatenate([below, np.flatnonzero(keyed == kth)[:k - len(below)]])
+    return part[np.lexsort((part, keyed[part]))]
+
+
+def extreme_rows(df, col, k, largest=False):
+    """The k rows with the smallest (or largest) `col`, ordered from the extreme inward.
+
+    Replaces sort_values(col).head(k) / .tail(k)[::-1]: np.argpartition finds
+    the k-th value in O(n) and only the k selected rows get sorted. Ties keep
+    row order; NaNs are never selected.
+    """
+    values = df[col].to_numpy(dtype=float)
+    valid = np.flatnonzero(~np.isnan(values))
+    keyed = -values[valid] if largest else values[valid]
+    k = min(k, len(valid))
+    if k == 0:
+        return df.iloc[:0]
+    kth = keyed[np.argpartition(keyed, k - 1)[k - 1]]
+    return df.iloc[valid[_smallest_positions(keyed, kth, k)]]
+
+
+def extreme_rows_both(df, col, k):
+    """(extreme_rows(df, col, k), extreme_rows(df, col, k, largest=True)) from one partition.
+
+    A single np.partition with both k-th positions places the k-th smallest and
+    the k-th largest value at once, so the column is read and partitioned once
+    for the two reports rather than once per side.
+    """
+    values = df[col].to_numpy(dtype=float)
+    valid = np.flatnonzero(~np.isnan(values))
+    v = values[valid]
+    k = min(k, len(valid))
+    if k == 0:
+        return df.iloc[:0], df.iloc[:0]
+    part = np.partition(v, [k - 1, len(v) - k])
+    return (df.iloc[valid[_smallest_positions(v, part[k - 1], k)]],
+            df.iloc[valid[_smallest_positions(-v, -part[len(v) - k], k)]])
+
+
+def anchor_similarity(pairwise, anchors, years=(2024, 2025)):
+    """(anchor, partner) × Year matrix of cosine similarity for pairs touching an anchor.
+
+    Pairs are stored once per unordered pair, so each year is scattered into a
+    dense symmetric country × country matrix (sim at [i, j] and [j, i]); an
+    anchor's partners are then just its row, gathered for every anchor at once
+    instead of filtering Country1 == a | Country2 == a per anchor. Anchor–anchor
+    pairs (e.g. USA–CHN) appear once from each side; partners missing in a
+    year are NaN, and partners missing in every year are dropped.
+    """
+    pw = pairwise[pairwise['Year'].isin(years)]
+    c1, c2 = pw['Country1_ISO3'], pw['Country2_ISO3']
+    if isinstance(c1.dtype, pd.CategoricalDtype) and isinstance(c2.dtype, pd.CategoricalDtype):
+        # Union the two short category arrays and remap each column's integer
+        # codes onto it, rather than sorting every stacked ISO3 string
+        cats1 = c1.cat.categories.to_numpy(dtype=str)
+        cats2 = c2.cat.categories.to_numpy(dtype=str)
+        countries = np.union1d(cats1, cats2)
+        i = np.searchsorted(countries, cats1)[c1.cat.codes.to_numpy()]
+        j = np.searchsorted(countries, cats2)[c2.cat.codes.to_numpy()]
+    else:
+        countries, codes = np.unique(
+            np.concatenate([c1.to_numpy(dtype=str), c2.to_numpy(dtype=str)]),
+            return_inverse=True)
+        i, j = codes[:len(pw)], codes[len(pw):]
+    year_labels, y = np.unique(pw['Year'].to_numpy(), return_inverse=True)
+    sim = pw['CosineSimilarity'].to_numpy()
+
+    dense = np.full((len(year_labels), len(countries), len(countries)), np.nan)
+    dense[y, i, j] = sim
+    dense[y, j, i] = sim
+
+    anchors = np.intersect1d(anchors, countries)
+    rows = dense[:, np.searchsorted(countries, anchors), :]
+    out = pd.DataFrame(rows.transpose(1, 2, 0).reshape(-1, len(year_labels)),
+                       index=pd.MultiIndex.from_product([anchors, countries],
+                                                        names=['anchor', 'partner']),
+                       columns=pd.Index(year_labels, name='Year'))
+    return out.dropna(how='all')
+
+
+def read_csv_cached(path, keep_years=None, **read_kwargs):
+    """pd.read_csv with a pickle cache of the parsed frame.
+
+    The cache lives in analysis/4C/.cache/ (git-ignored), is keyed on the file
+    name plus the read_csv arguments, and is rebuilt whenever the source CSV's
+    size or nanosecond mtime differs from the stamp stored next to the pickle.
+    Delete the folder to force a fresh parse.
+
+    keep_years=(column, years) streams the file in READ_CHUNK_ROWS chunks and
+    keeps only rows whose year is in `years` (the column itself if numeric,
+    else its leading 'YYYY'), so the other years are never held in memory at
+    once. The file's full row count is kept in df.attrs['source_rows'].
+    """
+    key_items = sorted(read_kwargs.items())
+    if keep_years is not None:
+        key_items.append(('keep_years', keep_years))
+    key = hashlib.md5(repr(key_items).encode()).hexdigest()[:8]
+    cached = CACHE_DIR / f"{path.stem}.{key}.pkl"
+    stamp_file = cached.with_suffix('.stamp')
+    source = path.stat()
+    stamp = f"{source.st_size} {source.st_mtime_ns}"
+    if cached.exists() and stamp_file.exists() and stamp_file.read_text() == stamp:
+        return pd.read_pickle(cached)
+    if keep_years is None:
+        df = pd.read_csv(path, **read_kwargs)
+    else:
+        col, years = keep_years
+        parts, source_rows = [], 0
+        with pd.read_csv(path, chunksize=READ_CHUNK_ROWS, **read_kwargs) as chunks:
+            for chunk in chunks:
+                source_rows += len(chunk)
+                year = chunk[col]
+                if not pd.api.types.is_numeric_dtype(year):
+                    year = pd.to_numeric(year.str[:4], errors='coerce')
+                parts.append(chunk[year.isin(years)])
+        # A header-only file may yield no chunks at all; keep its empty frame
+        df = pd.concat(parts) if parts else pd.read_csv(path, nrows=0, **read_kwargs)
+        # Each chunk infers its own categories, which concat cannot union, so
+        # any 'category' columns are re-cast once on the kept rows
+        categorical = [c for c, t in read_kwargs.get('dtype', {}).items() if t == 'category']
+        df = df.astype(dict.fromkeys(categorical, 'category'))
+        df.attrs['source_rows'] = source_rows
+    CACHE_DIR.mkdir(exist_ok=True)
+    df.to_pickle(cached)
+    stamp_file.write_text(stamp)
+    return df
+
+
+# Explicit read_csv dtypes / columns so pandas skips inference on the big files.
+# annual_scores is written back out whole (output 11), so it keeps every column;
+# only its gap-free rank / count columns are narrowed, and the ISO3 column is a
+# categorical (~200 codes repeated across 80 years). The score and similarity
+# columns stay float64: they are written verbatim to the output CSVs.
+# 'str' is pandas' own string dtype, stored in Arrow buffers whenever pyarrow is
+# installed, so no object columns reach the groupbys.
+ANNUAL_DTYPES = {'Country name': 'category', 'Year': 'int16', 'Overall Rank': 'int16',
+                 'Pillar 3 Rank': 'int16', 'Yes Votes': 'int16', 'No Votes': 'int16',
+                 'Abstain Votes': 'int16', 'Total Votes in Year': 'int16'}
+# Only these years of the two big files are ever used: the pairwise outputs
+# (07, 08, 14) compare 2024 with 2025, outputs 10 and 17 read 2025 resolutions
+PAIRWISE_YEARS = (2024, 2025)
+RAW_VOTES_YEARS = (2025,)
+# The pair ISO3 columns are categoricals too: ~190 codes over ~36k kept pairs
+PAIRWISE_DTYPES = {'Year': 'int16', 'Country1_ISO3': 'category', 'Country2_ISO3': 'category',
+                   'CosineSimilarity': 'float64'}
+# No output reads the topic No / Abstain counts, so those columns are skipped
+TOPIC_USECOLS = ['Year', 'Country', 'TopicTag', 'YesVotes_Topic', 'TotalVotes_Topic']
+TOPIC_DTYPES = {'Year': 'int16', 'Country': 'str', 'TopicTag': 'str',
+                'YesVotes_Topic': 'int32', 'TotalVotes_Topic': 'int32'}
+RAW_VOTES_USECOLS = ['id', 'Resolution', 'Date', 'Title', 'tags', 'vote_data', 'sc_flag']
+RAW_VOTES_DTYPES = {'id': 'int64', 'Resolution': 'str', 'Date': 'str', 'Title': 'str',
+                    'tags': 'str', 'vote_data': 'str', 'sc_flag': 'int8'}
+
 
 def load_data():
     """Load all four canonical CSVs."""
     separator("Loading data")
-    annual = pd.read_csv(DATA_DIR / "annual_scores (4).csv")
-    pairwise = pd.read_csv(DATA_DIR / "pairwise_similarity_yearly (4).csv")
-    topics = pd.read_csv(DATA_DIR / "topic_votes_yearly (4).csv")
-    raw_votes = pd.read_csv(DATA_DIR / "un_votes_with_sc (1).csv")
+    # The parses are independent and pandas' C parser releases the GIL, so the
+    # four files load on worker threads; the summary prints stay in order below
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        loads = [
+            pool.submit(read_csv_cached, DATA_DIR / "annual_scores (4).csv",
+                        dtype=ANNUAL_DTYPES),
+            pool.submit(read_csv_cached, DATA_DIR / "pairwise_similarity_yearly (4).csv",
+                        keep_years=('Year', PAIRWISE_YEARS), dtype=PAIRWISE_DTYPES),
+            pool.submit(read_csv_cached, DATA_DIR / "topic_votes_yearly (4).csv",
+                        usecols=TOPIC_USECOLS, dtype=TOPIC_DTYPES),
+            pool.submit(read_csv_cached, DATA_DIR / "un_votes_with_sc (1).csv",
+                        keep_years=('Date', RAW_VOTES_YEARS),
+                        usecols=RAW_VOTES_USECOLS, dtype=RAW_VOTES_DTYPES),
+        ]
+        annual, pairwise, topics, raw_votes = (load.result() for load in loads)
     print(f"  annual_scores:  {len(annual):,} rows, years {annual['Year'].min()}–{annual['Year'].max()}")
-    print(f"  pairwise:       {len(pairwise):,} rows")
+    print(f"  pairwise:       {pairwise.attrs['source_rows']:,} rows")
     print(f"  topic_votes:    {len(topics):,} rows")
-    print(f"  un_votes_raw:   {len(raw_votes):,} rows")
+    print(f"  un_votes_raw:   {raw_votes.attrs['source_rows']:,} rows")
+    # The pairwise file already stores each pair once (Country1_ISO3 <
+    # Country2_ISO3), so there is no mirrored half to drop; what shrinks the
+    # working set is the year filter applied while streaming it in.
     return annual, pairwise, topics, raw_votes
 
 
@@ -179,7 +383,7 @@ def load_data():
 def output_01_world_avg_trend(annual):
     separator("01 — World Average P1 Trend")
     # Exclude 2026 (partial year with only 4 resolutions)
-    df = annual[annual['Year'] <= 2025].copy()
+    df = annual[annual['Year'] <= 2025]
     trend = df.groupby('Year').agg(
         world_avg_p1=('Pillar 1 Score', 'mean'),
         median_p1=('Pillar 1 Score', 'median'),
@@ -200,9 +404,9 @@ def output_01_world_avg_trend(annual):
 
     # Print recent years
     recent = trend[trend['Year'] >= 2020]
-    for _, r in recent.iterrows():
-        chg = f"{r['yoy_change']:+.2f}" if pd.notna(r['yoy_change']) else "—"
-        print(f"    {int(r['Year'])}: avg={r['world_avg_p1']:.2f}  change={chg}  countries={int(r['num_countries'])}  avg_votes={r['avg_total_votes']:.0f}")
+    for r in recent.itertuples(index=False):
+        chg = f"{r.yoy_change:+.2f}" if pd.notna(r.yoy_change) else "—"
+        print(f"    {int(r.Year)}: avg={r.world_avg_p1:.2f}  change={chg}  countries={int(r.num_countries)}  avg_votes={r.avg_total_votes:.0f}")
 
     # Key metric
     p1_24 = trend.loc[trend['Year'] == 2024, 'world_avg_p1'].values[0]
@@ -214,24 +418,25 @@ def output_01_world_avg_trend(annual):
 # ═══════════════════════════════════════════════════════════════════════════
 # OUTPUT 02: Country-Level P1 Shifts (2024 → 2025)
 # ═══════════════════════════════════════════════════════════════════════════
-def output_02_country_shifts(annual):
+def output_02_country_shifts(annual_by_year):
     separator("02 — Country-Level P1 Shifts (2024 → 2025)")
-    d24 = annual[annual['Year'] == 2024][['Country name', 'Pillar 1 Score',
-        'Yes Votes', 'No Votes', 'Abstain Votes', 'Total Votes in Year']].copy()
-    d24.columns = ['iso3', 'p1_2024', 'yes_2024', 'no_2024', 'abstain_2024', 'total_2024']
-
-    d25 = annual[annual['Year'] == 2025][['Country name', 'Pillar 1 Score',
-        'Yes Votes', 'No Votes', 'Abstain Votes', 'Total Votes in Year']].copy()
-    d25.columns = ['iso3', 'p1_2025', 'yes_2025', 'no_2025', 'abstain_2025', 'total_2025']
-
-    merged = pd.merge(d24, d25, on='iso3', how='outer')
+    cols = ['Pillar 1 Score', 'Yes Votes', 'No Votes', 'Abstain Votes', 'Total Votes in Year']
+    d24 = annual_by_year[2024].set_index('Country name')
+    d25 = annual_by_year[2025].set_index('Country name')
+
+    # Align both years on one sorted ISO3 index (same rows as an outer merge),
+    # then lay the blocks side by side instead of joining the frames
+    iso3 = d24.index.union(d25.index)
+    merged = pd.concat([
+        d24[cols].reindex(iso3).set_axis(['p1_2024', 'yes_2024', 'no_2024', 'abstain_2024', 'total_2024'], axis=1),
+        d25[cols].reindex(iso3).set_axis(['p1_2025', 'yes_2025', 'no_2025', 'abstain_2025', 'total_2025'], axis=1),
+    ], axis=1).rename_axis('iso3').reset_index()
     merged['p1_change'] = (merged['p1_2025'] - merged['p1_2024']).round(2)
     merged['total_change'] = merged['total_2025'] - merged['total_2024']
-    merged['yes_pct_2024'] = (merged['yes_2024'] / merged['total_2024'] * 100).round(1)
-    merged['yes_pct_2025'] = (merged['yes_2025'] / merged['total_2025'] * 100).round(1)
+    merged['yes_pct_2024'] = d24['yes_pct'].reindex(iso3).to_numpy()
+    merged['yes_pct_2025'] = d25['yes_pct'].reindex(iso3).to_numpy()
     merged['yes_pct_change'] = (merged['yes_pct_2025'] - merged['yes_pct_2024']).round(1)
-    merged['region'] = merged['iso3'].map(ISO3_TO_REGION)
-    merged['broad_region'] = merged['region'].map(SUBREGION_TO_BROAD)
+    merged['region'], merged['broad_region'] = region_lookup(merged['iso3'])
     merged = merged.sort_values('p1_change', ascending=True)
 
     out = OUT_DIR / "02_p1_country_shifts_2024_2025.csv"
@@ -240,13 +445,13 @@ def output_02_country_shifts(annual):
 
     # Show top decliners and gainers
     print("\n  Top 10 DECLINERS:")
-    for _, r in merged.head(10).iterrows():
-        print(f"    {r['iso3']}: {r['p1_change']:+.1f} ({r['p1_2024']:.1f} → {r['p1_2025']:.1f}) "
-              f"votes: {int(r['total_2024']) if pd.notna(r['total_2024']) else '?'} → {int(r['total_2025']) if pd.notna(r['total_2025']) else '?'}")
+    for r in merged.head(10).itertuples(index=False):
+        print(f"    {r.iso3}: {r.p1_change:+.1f} ({r.p1_2024:.1f} → {r.p1_2025:.1f}) "
+              f"votes: {int(r.total_2024) if pd.notna(r.total_2024) else '?'} → {int(r.total_2025) if pd.notna(r.total_2025) else '?'}")
     print("\n  Top 10 GAINERS:")
-    for _, r in merged.tail(10).iloc[::-1].iterrows():
-        print(f"    {r['iso3']}: {r['p1_change']:+.1f} ({r['p1_2024']:.1f} → {r['p1_2025']:.1f}) "
-              f"votes: {int(r['total_2024']) if pd.notna(r['total_2024']) else '?'} → {int(r['total_2025']) if pd.notna(r['total_2025']) else '?'}")
+    for r in merged.tail(10).iloc[::-1].itertuples(index=False):
+        print(f"    {r.iso3}: {r.p1_change:+.1f} ({r.p1_2024:.1f} → {r.p1_2025:.1f}) "
+              f"votes: {int(r.total_2024) if pd.notna(r.total_2024) else '?'} → {int(r.total_2025) if pd.notna(r.total_2025) else '?'}")
     return merged
 
 
@@ -255,8 +460,8 @@ def output_02_country_shifts(annual):
 # ═══════════════════════════════════════════════════════════════════════════
 def output_03_big_movers(shifts):
     separator("03 — Big Movers (>10pt P1 swing)")
-    big = shifts[shifts['p1_change'].abs() > 10].copy()
-    big['direction'] = np.where(big['p1_change'] > 0, 'GAINER', 'DECLINER')
+    big = shifts[shifts['p1_change'].abs() > 10]
+    big = big.assign(direction=np.where(big['p1_change'] > 0, 'GAINER', 'DECLINER'))
     big = big.sort_values('p1_change')
 
     out = OUT_DIR / "03_p1_big_movers.csv"
@@ -272,8 +477,8 @@ def output_03_big_movers(shifts):
 # ═══════════════════════════════════════════════════════════════════════════
 def output_04_participation(shifts):
     separator("04 — Participation Analysis")
-    df = shifts.dropna(subset=['total_2024', 'total_2025']).copy()
-    df['participation_change_pct'] = ((df['total_2025'] - df['total_2024']) / df['total_2024'] * 100).round(1)
+    df = shifts.dropna(subset=['total_2024', 'total_2025'])
+    df = df.assign(participation_change_pct=((df['total_2025'] - df['total_2024']) / df['total_2024'] * 100).round(1))
     df = df.sort_values('participation_change_pct')
 
     out = OUT_DIR / "04_p1_participation_analysis.csv"
@@ -286,38 +491,45 @@ def output_04_participation(shifts):
     spotty = df[(df['total_2025'] < 50) | (df['total_2024'] < 50) |
                 (df['participation_change_pct'].abs() > 50)]
     print(f"  Spotty voting candidates: {len(spotty)} countries")
-    for _, r in spotty.sort_values('p1_change').head(10).iterrows():
-        print(f"    {r['iso3']}: votes {int(r['total_2024'])}→{int(r['total_2025'])} "
-              f"({r['participation_change_pct']:+.0f}%), P1 change {r['p1_change']:+.1f}")
+    for r in extreme_rows(spotty, 'p1_change', 10).itertuples(index=False):
+        print(f"    {r.iso3}: votes {int(r.total_2024)}→{int(r.total_2025)} "
+              f"({r.participation_change_pct:+.0f}%), P1 change {r.p1_change:+.1f}")
     return df
 
 
 # ═══════════════════════════════════════════════════════════════════════════
 # OUTPUT 05: Topic-Level Alignment Changes (Yes% by topic, 2024 → 2025)
 # ═══════════════════════════════════════════════════════════════════════════
-def output_05_topic_changes(topics):
-    separator("05 — Topic-Level Alignment Changes")
-    for year in [2024, 2025]:
-        sub = topics[topics['Year'] == year]
-        print(f"  {year}: {sub['TopicTag'].nunique()} topics, {len(sub)} rows")
-
-    # Aggregate per topic per year
-    agg = topics[topics['Year'].isin([2024, 2025])].groupby(['Year', 'TopicTag']).agg(
-        total_yes=('YesVotes_Topic', 'sum'),
-        total_no=('NoVotes_Topic', 'sum'),
-        total_abstain=('AbstainVotes_Topic', 'sum'),
-        total_votes=('TotalVotes_Topic', 'sum'),
-        num_countries=('Country', 'nunique')
-    ).reset_index()
-    agg['yes_pct'] = (agg['total_yes'] / agg['total_votes'] * 100).round(2)
+def topic_year_totals(topics, years=(2024, 2025)):
+    """Yes / total votes, country count and row count per (Year, TopicTag).
 
-    # Pivot for comparison
-    p24 = agg[agg['Year'] == 2024][['TopicTag', 'yes_pct', 'total_votes', 'num_countries']].copy()
-    p24.columns = ['TopicTag', 'yes_pct_2024', 'total_votes_2024', 'num_countries_2024']
-    p25 = agg[agg['Year'] == 2025][['TopicTag', 'yes_pct', 'total_votes', 'num_countries']].copy()
-    p25.columns = ['TopicTag', 'yes_pct_2025', 'total_votes_2025', 'num_countries_2025']
+    Outputs 05 and 06 both summarise the same 2024/2025 topic groups, so the
+    topic rows are grouped once here and each output reads what it needs.
+    """
+    return (topics[topics['Year'].isin(years)]
+            .groupby(['Year', 'TopicTag'])
+            .agg(total_yes=('YesVotes_Topic', 'sum'),
+                 total_votes=('TotalVotes_Topic', 'sum'),
+                 num_countries=('Country', 'nunique'),
+                 num_rows=('TopicTag', 'size')))
 
-    compare = pd.merge(p24, p25, on='TopicTag', how='outer')
+
+def output_05_topic_changes(topic_totals):
+    separator("05 — Topic-Level Alignment Changes")
+    per_year = topic_totals.groupby(level='Year')['num_rows'].agg(['size', 'sum'])
+    for year in [2024, 2025]:
+        n_topics, n_rows = per_year.loc[year] if year in per_year.index else (0, 0)
+        print(f"  {year}: {n_topics} topics, {n_rows} rows")
+
+    # Unstack the per-topic, per-year totals side by side (the outer join
+    # across years falls out of the unstack)
+    agg = topic_totals.assign(
+        yes_pct=(topic_totals['total_yes'] / topic_totals['total_votes'] * 100).round(2))
+
+    wide = agg[['yes_pct', 'total_votes', 'num_countries']].unstack('Year')
+    compare = pd.concat(
+        [wide.xs(year, axis=1, level='Year').add_suffix(f'_{year}') for year in [2024, 2025]],
+        axis=1).reset_index()
     compare['yes_pct_change'] = (compare['yes_pct_2025'] - compare['yes_pct_2024']).round(2)
     compare = compare.sort_values('yes_pct_change', ascending=True)
 
@@ -328,54 +540,52 @@ def output_05_topic_changes(topics):
     # Show biggest shifts
     both = compare.dropna(subset=['yes_pct_2024', 'yes_pct_2025'])
     print(f"\n  Top 5 DECLINING topics (present in both years):")
-    for _, r in both.head(5).iterrows():
-        print(f"    {r['TopicTag']}: {r['yes_pct_change']:+.1f}pp ({r['yes_pct_2024']:.1f}% → {r['yes_pct_2025']:.1f}%)")
+    for r in both.head(5).itertuples(index=False):
+        print(f"    {r.TopicTag}: {r.yes_pct_change:+.1f}pp ({r.yes_pct_2024:.1f}% → {r.yes_pct_2025:.1f}%)")
     print(f"\n  Top 5 GROWING topics:")
-    for _, r in both.tail(5).iloc[::-1].iterrows():
-        print(f"    {r['TopicTag']}: {r['yes_pct_change']:+.1f}pp ({r['yes_pct_2024']:.1f}% → {r['yes_pct_2025']:.1f}%)")
+    for r in both.tail(5).iloc[::-1].itertuples(index=False):
+        print(f"    {r.TopicTag}: {r.yes_pct_change:+.1f}pp ({r.yes_pct_2024:.1f}% → {r.yes_pct_2025:.1f}%)")
     return compare
 
 
 # ═══════════════════════════════════════════════════════════════════════════
 # OUTPUT 06: New & Dropped Topics
 # ═══════════════════════════════════════════════════════════════════════════
-def output_06_topic_new_dropped(topics):
+def output_06_topic_new_dropped(topic_totals):
     separator("06 — New & Dropped Topics")
-    tags_24 = set(topics[topics['Year'] == 2024]['TopicTag'].unique())
-    tags_25 = set(topics[topics['Year'] == 2025]['TopicTag'].unique())
-
-    new_tags = tags_25 - tags_24
-    dropped_tags = tags_24 - tags_25
-
-    # Get vote data for new tags
-    rows = []
-    for tag in sorted(new_tags):
-        sub = topics[(topics['Year'] == 2025) & (topics['TopicTag'] == tag)]
-        rows.append({
-            'TopicTag': tag, 'status': 'NEW_IN_2025',
-            'total_votes': sub['TotalVotes_Topic'].sum(),
-            'yes_pct': round(sub['YesVotes_Topic'].sum() / sub['TotalVotes_Topic'].sum() * 100, 1) if sub['TotalVotes_Topic'].sum() > 0 else None,
-            'num_countries': sub['Country'].nunique()
-        })
-    for tag in sorted(dropped_tags):
-        sub = topics[(topics['Year'] == 2024) & (topics['TopicTag'] == tag)]
-        rows.append({
-            'TopicTag': tag, 'status': 'DROPPED_FROM_2024',
-            'total_votes': sub['TotalVotes_Topic'].sum(),
-            'yes_pct': round(sub['YesVotes_Topic'].sum() / sub['TotalVotes_Topic'].sum() * 100, 1) if sub['TotalVotes_Topic'].sum() > 0 else None,
-            'num_countries': sub['Country'].nunique()
-        })
-
-    out_df = pd.DataFrame(rows)
+    # Each year's tags are the TopicTag level of its groups in topic_totals
+    group_year = topic_totals.index.get_level_values('Year')
+    group_tag = topic_totals.index.get_level_values('TopicTag')
+    tags_24, tags_25 = group_tag[group_year == 2024], group_tag[group_year == 2025]
+
+    # Index.difference is a hash-based set difference and returns sorted labels
+    new_tags = tags_25.difference(tags_24)
+    dropped_tags = tags_24.difference(tags_25)
+
+    # Each status block is one reindex of that year's aggregates by its tag
+    # list, with yes_pct derived column-wise rather than per tag
+    blocks = []
+    for year, status, tags in [(2025, 'NEW_IN_2025', new_tags), (2024, 'DROPPED_FROM_2024', dropped_tags)]:
+        g = topic_totals.reindex(pd.MultiIndex.from_product([[year], tags]))
+        blocks.append(pd.DataFrame({
+            'TopicTag': tags, 'status': status,
+            'total_votes': g['total_votes'].to_numpy(),
+            'yes_pct': (g['total_yes'] / g['total_votes'] * 100).round(1)
+                       .where(g['total_votes'] > 0).to_numpy(),
+            'num_countries': g['num_countries'].to_numpy(),
+        }))
+
+    out_df = pd.concat(blocks, ignore_index=True)
     out = OUT_DIR / "06_p1_topic_new_dropped.csv"
     out_df.to_csv(out, index=False)
     print(f"  ✓ Saved {out.name}")
     print(f"    New in 2025: {len(new_tags)} topics")
-    for tag in sorted(new_tags):
-        r = out_df[out_df['TopicTag'] == tag].iloc[0]
+    by_name = out_df.set_index('TopicTag')
+    for tag in new_tags:
+        r = by_name.loc[tag]
         print(f"      {tag} (Yes%={r['yes_pct']}%, votes={int(r['total_votes'])})")
     print(f"    Dropped from 2024: {len(dropped_tags)} topics")
-    for tag in sorted(dropped_tags):
+    for tag in dropped_tags:
         print(f"      {tag}")
     return out_df
 
@@ -385,18 +595,16 @@ def output_06_topic_new_dropped(topics):
 # ═══════════════════════════════════════════════════════════════════════════
 def output_07_pairwise_shifts(pairwise):
     separator("07 — Pairwise Similarity Biggest Shifts")
-    pw24 = pairwise[pairwise['Year'] == 2024][['Country1_ISO3', 'Country2_ISO3', 'CosineSimilarity']].copy()
-    pw24.columns = ['c1', 'c2', 'sim_2024']
-    pw25 = pairwise[pairwise['Year'] == 2025][['Country1_ISO3', 'Country2_ISO3', 'CosineSimilarity']].copy()
-    pw25.columns = ['c1', 'c2', 'sim_2025']
+    pw24 = pairwise[pairwise['Year'] == 2024][['Country1_ISO3', 'Country2_ISO3', 'CosineSimilarity']]
+    pw24 = pw24.set_axis(['c1', 'c2', 'sim_2024'], axis=1)
+    pw25 = pairwise[pairwise['Year'] == 2025][['Country1_ISO3', 'Country2_ISO3', 'CosineSimilarity']]
+    pw25 = pw25.set_axis(['c1', 'c2', 'sim_2025'], axis=1)
 
-    merged = pd.merge(pw24, pw25, on=['c1', 'c2'], how='inner')
+    merged = pd.merge(pw24, pw25, on=['c1', 'c2'], how='inner', validate='one_to_one')
     merged['sim_change'] = (merged['sim_2025'] - merged['sim_2024']).round(4)
 
-    # Top diverging and converging pairs
-    merged_sorted = merged.sort_values('sim_change')
-    top_diverging = merged_sorted.head(50)
-    top_converging = merged_sorted.tail(50).iloc[::-1]
+    # Top diverging and converging pairs, by one partial selection rather than a full sort
+    top_diverging, top_converging = extreme_rows_both(merged, 'sim_change', 50)
     combined = pd.concat([top_diverging, top_converging])
 
     out = OUT_DIR / "07_p1_pairwise_biggest_shifts.csv"
@@ -404,11 +612,11 @@ def output_07_pairwise_shifts(pairwise):
     print(f"  ✓ Saved {out.name} (top 50 diverging + top 50 converging)")
 
     print("\n  Top 10 DIVERGING pairs:")
-    for _, r in top_diverging.head(10).iterrows():
-        print(f"    {r['c1']}-{r['c2']}: {r['sim_change']:+.3f} ({r['sim_2024']:.3f} → {r['sim_2025']:.3f})")
+    for r in top_diverging.head(10).itertuples(index=False):
+        print(f"    {r.c1}-{r.c2}: {r.sim_change:+.3f} ({r.sim_2024:.3f} → {r.sim_2025:.3f})")
     print("\n  Top 10 CONVERGING pairs:")
-    for _, r in top_converging.head(10).iterrows():
-        print(f"    {r['c1']}-{r['c2']}: {r['sim_change']:+.3f} ({r['sim_2024']:.3f} → {r['sim_2025']:.3f})")
+    for r in top_converging.head(10).itertuples(index=False):
+        print(f"    {r.c1}-{r.c2}: {r.sim_change:+.3f} ({r.sim_2024:.3f} → {r.sim_2025:.3f})")
     return merged
 
 
@@ -422,27 +630,14 @@ def output_08_us_alliance_shifts(pairwise):
                     'SAU', 'ARE', 'TUR', 'UKR', 'CHN', 'RUS', 'ARG', 'NGA',
                     'ZAF', 'EGY', 'IDN', 'NOR', 'SWE', 'DNK', 'HUN', 'SVK']
 
-    # Get US rows (US can be c1 or c2)
-    us_24 = pairwise[(pairwise['Year'] == 2024) &
-                      ((pairwise['Country1_ISO3'] == 'USA') | (pairwise['Country2_ISO3'] == 'USA'))].copy()
-    us_25 = pairwise[(pairwise['Year'] == 2025) &
-                      ((pairwise['Country1_ISO3'] == 'USA') | (pairwise['Country2_ISO3'] == 'USA'))].copy()
+    # USA plus the CHN / RUS comparison anchors, oriented in one pass
+    sims = anchor_similarity(pairwise, ['USA', 'CHN', 'RUS'])
 
-    def normalize_us(row):
-        if row['Country1_ISO3'] == 'USA':
-            return row['Country2_ISO3']
-        return row['Country1_ISO3']
-
-    us_24['partner'] = us_24.apply(normalize_us, axis=1)
-    us_25['partner'] = us_25.apply(normalize_us, axis=1)
-
-    us_24_s = us_24[['partner', 'CosineSimilarity']].rename(columns={'CosineSimilarity': 'sim_2024'})
-    us_25_s = us_25[['partner', 'CosineSimilarity']].rename(columns={'CosineSimilarity': 'sim_2025'})
-
-    us_merged = pd.merge(us_24_s, us_25_s, on='partner', how='outer')
+    us_merged = (sims.loc['USA', [2024, 2025]].set_axis(['sim_2024', 'sim_2025'], axis=1)
+                 .rename_axis('partner').reset_index())
     us_merged['sim_change'] = (us_merged['sim_2025'] - us_merged['sim_2024']).round(4)
     us_merged['is_key_partner'] = us_merged['partner'].isin(KEY_PARTNERS)
-    us_merged['region'] = us_merged['partner'].map(ISO3_TO_REGION)
+    us_merged['region'], _ = region_lookup(us_merged['partner'])
     us_merged = us_merged.sort_values('sim_change')
 
     out = OUT_DIR / "08_p1_us_alliance_shifts.csv"
@@ -451,28 +646,17 @@ def output_08_us_alliance_shifts(pairwise):
 
     print("\n  US key partner shifts:")
     key = us_merged[us_merged['is_key_partner']].sort_values('sim_change')
-    for _, r in key.iterrows():
-        print(f"    USA-{r['partner']}: {r['sim_change']:+.4f} ({r['sim_2024']:.3f} → {r['sim_2025']:.3f})")
+    for r in key.itertuples(index=False):
+        print(f"    USA-{r.partner}: {r.sim_change:+.4f} ({r.sim_2024:.3f} → {r.sim_2025:.3f})")
 
     # Also do the same for CHN and RUS to see bloc dynamics
     for anchor in ['CHN', 'RUS']:
-        a24 = pairwise[(pairwise['Year'] == 2024) &
-                        ((pairwise['Country1_ISO3'] == anchor) | (pairwise['Country2_ISO3'] == anchor))].copy()
-        a25 = pairwise[(pairwise['Year'] == 2025) &
-                        ((pairwise['Country1_ISO3'] == anchor) | (pairwise['Country2_ISO3'] == anchor))].copy()
-        def normalize_a(row):
-            if row['Country1_ISO3'] == anchor:
-                return row['Country2_ISO3']
-            return row['Country1_ISO3']
-        a24['partner'] = a24.apply(normalize_a, axis=1)
-        a25['partner'] = a25.apply(normalize_a, axis=1)
-        a24_s = a24[['partner', 'CosineSimilarity']].rename(columns={'CosineSimilarity': f'sim_{anchor}_2024'})
-        a25_s = a25[['partner', 'CosineSimilarity']].rename(columns={'CosineSimilarity': f'sim_{anchor}_2025'})
-        am = pd.merge(a24_s, a25_s, on='partner', how='outer')
+        am = (sims.loc[anchor, [2024, 2025]]
+              .set_axis([f'sim_{anchor}_2024', f'sim_{anchor}_2025'], axis=1)
+              .rename_axis('partner').reset_index())
         am[f'sim_{anchor}_change'] = (am[f'sim_{anchor}_2025'] - am[f'sim_{anchor}_2024']).round(4)
         # Merge into us_merged
-        us_merged = pd.merge(us_merged, am[['partner', f'sim_{anchor}_2024', f'sim_{anchor}_2025', f'sim_{anchor}_change']],
-                             on='partner', how='left')
+        us_merged = pd.merge(us_merged, am, on='partner', how='left', validate='one_to_one')
 
     out2 = OUT_DIR / "08b_p1_bloc_alliance_shifts.csv"
     us_merged.to_csv(out2, index=False)
@@ -483,34 +667,33 @@ def output_08_us_alliance_shifts(pairwise):
 # ═══════════════════════════════════════════════════════════════════════════
 # OUTPUT 09: Regional Summary
 # ═══════════════════════════════════════════════════════════════════════════
-def output_09_regional(annual):
+def output_09_regional(annual_by_year):
     separator("09 — Regional Summary")
-    d24 = annual[annual['Year'] == 2024].copy()
-    d25 = annual[annual['Year'] == 2025].copy()
-
-    for df in [d24, d25]:
-        df['subregion'] = df['Country name'].map(ISO3_TO_REGION)
-        df['broad_region'] = df['subregion'].map(SUBREGION_TO_BROAD)
-
-    unmapped_24 = d24[d24['broad_region'].isna()]['Country name'].unique()
-    unmapped_25 = d25[d25['broad_region'].isna()]['Country name'].unique()
+    # Attach the region labels once, as categoricals, to both years stacked;
+    # each summary level is then a single (region, Year) groupby unstacked
+    # side by side (the outer join across years falls out of the unstack)
+    both = with_regions(pd.concat([annual_by_year[2024], annual_by_year[2025]]),
+                        'Country name', region_col='subregion')
+    both = both.astype({'broad_region': 'category', 'subregion': 'category'})
+
+    unmapped = both.loc[both['broad_region'].isna(), ['Year', 'Country name']]
+    unmapped_24 = unmapped.loc[unmapped['Year'] == 2024, 'Country name'].unique()
+    unmapped_25 = unmapped.loc[unmapped['Year'] == 2025, 'Country name'].unique()
     if len(unmapped_24) > 0 or len(unmapped_25) > 0:
         print(f"  ⚠️ Unmapped countries 2024: {list(unmapped_24)}")
         print(f"  ⚠️ Unmapped countries 2025: {list(unmapped_25)}")
 
-    # Broad region summary
-    r24 = d24.groupby('broad_region').agg(
-        avg_p1_2024=('Pillar 1 Score', 'mean'),
-        median_p1_2024=('Pillar 1 Score', 'median'),
-        n_countries_2024=('Country name', 'nunique')
-    ).reset_index()
-    r25 = d25.groupby('broad_region').agg(
-        avg_p1_2025=('Pillar 1 Score', 'mean'),
-        median_p1_2025=('Pillar 1 Score', 'median'),
-        n_countries_2025=('Country name', 'nunique')
-    ).reset_index()
+    def summarize(key, **aggs):
+        wide = both.groupby([key, 'Year'], observed=True).agg(**aggs).unstack('Year')
+        wide = wide[[(stat, year) for year in [2024, 2025] for stat in aggs]]
+        wide.columns = [f'{stat}_{year}' for stat, year in wide.columns]
+        return wide.reset_index()
 
-    reg = pd.merge(r24, r25, on='broad_region', how='outer')
+    # Broad region summary
+    reg = summarize('broad_region',
+                    avg_p1=('Pillar 1 Score', 'mean'),
+                    median_p1=('Pillar 1 Score', 'median'),
+                    n_countries=('Country name', 'nunique'))
     reg['avg_p1_change'] = (reg['avg_p1_2025'] - reg['avg_p1_2024']).round(2)
     reg['median_p1_change'] = (reg['median_p1_2025'] - reg['median_p1_2024']).round(2)
     reg = reg.sort_values('avg_p1_change')
@@ -522,19 +705,13 @@ def output_09_regional(annual):
     out = OUT_DIR / "09_p1_regional_summary.csv"
     reg.to_csv(out, index=False)
     print(f"  ✓ Saved {out.name}")
-    for _, r in reg.iterrows():
-        print(f"    {r['broad_region']}: {r['avg_p1_2024']:.1f} → {r['avg_p1_2025']:.1f} ({r['avg_p1_change']:+.1f})")
+    for r in reg.itertuples(index=False):
+        print(f"    {r.broad_region}: {r.avg_p1_2024:.1f} → {r.avg_p1_2025:.1f} ({r.avg_p1_change:+.1f})")
 
     # Also subregion level
-    sr24 = d24.groupby('subregion').agg(
-        avg_p1_2024=('Pillar 1 Score', 'mean'),
-        n_countries_2024=('Country name', 'nunique')
-    ).reset_index()
-    sr25 = d25.groupby('subregion').agg(
-        avg_p1_2025=('Pillar 1 Score', 'mean'),
-        n_countries_2025=('Country name', 'nunique')
-    ).reset_index()
-    sreg = pd.merge(sr24, sr25, on='subregion', how='outer')
+    sreg = summarize('subregion',
+                     avg_p1=('Pillar 1 Score', 'mean'),
+                     n_countries=('Country name', 'nunique'))
     sreg['avg_p1_change'] = (sreg['avg_p1_2025'] - sreg['avg_p1_2024']).round(2)
     sreg = sreg.sort_values('avg_p1_change')
 
@@ -544,81 +721,158 @@ def output_09_regional(annual):
     return reg
 
 
+# ═══════════════════════════════════════════════════════════════════════════
+# Resolution selection and vote matrix (shared by outputs 10 and 17)
+# ═══════════════════════════════════════════════════════════════════════════
+def select_ga_resolutions(raw_votes, year, include_es=False):
+    """GA resolutions (sc_flag == 0) from `year`, with Date parsed to UTC.
+
+    include_es also keeps that year's ES- (emergency special session)
+    resolutions, appended after the GA rows and de-duplicated on id.
+    """
+    # Narrow on the raw string first so only that year's rows get parsed. Dates
+    # are stored as UTC ('+00') or tz-less, so the 'YYYY' prefix is already the
+    # UTC year; the parsed Year check below still has the final say.
+    df = raw_votes[raw_votes['Date'].str.startswith(str(year), na=False)]
+    # Dates mix 'YYYY-MM-DD HH:MM:SS+00' with tz-less forms, hence format='mixed';
+    # cache=True parses each distinct string once (many resolutions share a date)
+    dates = pd.to_datetime(df['Date'], format='mixed', utc=True, cache=True)
+    df = df.assign(Date=dates, Year=dates.dt.year)
+    in_year = df['Year'] == year
+    ga = df[in_year & (df['sc_flag'] == 0)]
+    if include_es:
+        es = df[df['Resolution'].str.contains('ES-', na=False) & in_year]
+        ga = pd.concat([ga, es]).drop_duplicates(subset='id')
+    return ga
+
+
+def iso_dates(dates):
+    """YYYY-MM-DD strings for a UTC datetime Series, via one datetime64[D] cast."""
+    return dates.dt.tz_convert(None).to_numpy().astype('datetime64[D]').astype(str)
+
+
+def parse_vote_data(raw):
+    """Decode one vote_data JSON cell; None if the cell is missing or malformed."""
+    try:
+        return json.loads(raw)
+    except (json.JSONDecodeError, TypeError):
+        return None
+
+
+# int8 codes for the vote matrix; 0 = null / absent / anything unrecognised
+VOTE_CODES = {'YES': 1, 'NO': 2, 'ABSTAIN': 3}
+VOTE_LABELS = np.array(['ABSENT', 'YES', 'NO', 'ABSTAIN'])
+
+
+def vote_code(vote):
+    """VOTE_CODES entry for one vote value, by equality so lists/dicts map to 0."""
+    for label, code in VOTE_CODES.items():
+        if vote == label:
+            return code
+    return 0
+
+
+def build_vote_matrix(ga):
+    """Parse vote_data once into a (resolutions × countries) int8 code matrix.
+
+    Returns the rows that decoded cleanly, their decoded vote dicts, the sorted
+    ISO3 column order and the matrix itself, encoded with VOTE_CODES. Tallies
+    come from its packed bit planes; see pack_vote_planes / count_vote_planes.
+    """
+    parsed = [parse_vote_data(v) for v in ga['vote_data']]
+    keep = np.array([v is not None for v in parsed], dtype=bool)
+    parsed = [v for v in parsed if v is not None]
+    countries = sorted(set().union(*parsed)) if parsed else []
+    codes = np.array([[vote_code(votes.get(c)) for c in countries] for votes in parsed],
+                     dtype=np.int8).reshape(len(parsed), len(countries))
+    return ga[keep], parsed, countries, codes
+
+
+def pack_vote_planes(codes):
+    """Bit-pack a code matrix into two bit planes along its last axis.
+
+    Two bits per vote: YES = 11, NO = 10, ABSTAIN = 01, absent = 00, with the
+    first bit in p0 and the second in p1. Pass codes.T to pack per country.
+    """
+    p0 = np.packbits((codes == VOTE_CODES['YES']) | (codes == VOTE_CODES['NO']), axis=-1)
+    p1 = np.packbits((codes == VOTE_CODES['YES']) | (codes == VOTE_CODES['ABSTAIN']), axis=-1)
+    return p0, p1
+
+
+def _popcount(bits):
+    """Set bits per row of a packed uint8 array."""
+    if hasattr(np, 'bitwise_count'):  # NumPy ≥ 2.0
+        return np.bitwise_count(bits).sum(axis=-1, dtype=np.int64)
+    return np.unpackbits(bits, axis=-1).sum(axis=-1, dtype=np.int64)
+
+
+def count_vote_planes(p0, p1):
+    """(yes, no, abstain) counts per row of a pair of packed vote planes."""
+    return _popcount(p0 & p1), _popcount(p0 & ~p1), _popcount(~p0 & p1)
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # OUTPUT 10: Most Divisive Resolutions in 2025
 # ═══════════════════════════════════════════════════════════════════════════
 def output_10_divisive_resolutions(raw_votes):
     separator("10 — Most Divisive Resolutions (2025)")
-    # Filter to 2025 GA resolutions (sc_flag == 0)
-    df = raw_votes.copy()
-    df['Date'] = pd.to_datetime(df['Date'], format='mixed', utc=True)
-    df['Year'] = df['Date'].dt.year
-
-    # Get 2025 resolutions that are GA (sc_flag=0)
-    ga25 = df[(df['Year'] == 2025) & (df['sc_flag'] == 0)].copy()
-    # Also include ES- (emergency special session) resolutions from 2025
-    es = df[df['Resolution'].str.contains('ES-', na=False) & (df['Year'] == 2025)]
-    ga25 = pd.concat([ga25, es]).drop_duplicates(subset='id')
+    # 2025 GA resolutions (sc_flag == 0) plus 2025 ES- emergency session ones
+    ga25 = select_ga_resolutions(raw_votes, 2025, include_es=True)
 
     print(f"  Total 2025-era GA resolutions: {len(ga25)}")
 
-    rows = []
-    for _, res in ga25.iterrows():
-        try:
-            votes = json.loads(res['vote_data'])
-        except (json.JSONDecodeError, TypeError):
-            continue
-        yes = sum(1 for v in votes.values() if v == 'YES')
-        no = sum(1 for v in votes.values() if v == 'NO')
-        abstain = sum(1 for v in votes.values() if v == 'ABSTAIN')
-        total = yes + no + abstain
-        if total == 0:
-            continue
-        non_yes_pct = round((no + abstain) / total * 100, 1)
-        rows.append({
-            'resolution': res['Resolution'],
-            'title': res['Title'],
-            'date': res['Date'].strftime('%Y-%m-%d'),
-            'yes': yes, 'no': no, 'abstain': abstain, 'total': total,
-            'non_yes_pct': non_yes_pct,
-            'no_pct': round(no / total * 100, 1),
-            'tags': res['tags']
-        })
-
-    res_df = pd.DataFrame(rows).sort_values('non_yes_pct', ascending=False)
+    ga25, _, _, codes = build_vote_matrix(ga25)
+    yes_counts, no_counts, abstain_counts = count_vote_planes(*pack_vote_planes(codes))
+
+    total_counts = yes_counts + no_counts + abstain_counts
+    # Resolutions with no recorded YES/NO/ABSTAIN votes carry no signal
+    voted = total_counts > 0
+    ga25 = ga25[voted]
+
+    res_df = pd.DataFrame({
+        'resolution': ga25['Resolution'].to_numpy(),
+        'title': ga25['Title'].to_numpy(),
+        'date': iso_dates(ga25['Date']),
+        'yes': yes_counts[voted],
+        'no': no_counts[voted],
+        'abstain': abstain_counts[voted],
+        'total': total_counts[voted],
+    })
+    res_df['non_yes_pct'] = ((res_df['no'] + res_df['abstain']) / res_df['total'] * 100).round(1)
+    res_df['no_pct'] = (res_df['no'] / res_df['total'] * 100).round(1)
+    res_df['tags'] = ga25['tags'].to_numpy()
+    res_df = res_df.sort_values('non_yes_pct', ascending=False)
 
     out = OUT_DIR / "10_p1_divisive_resolutions_2025.csv"
     res_df.to_csv(out, index=False)
     print(f"  ✓ Saved {out.name} ({len(res_df)} resolutions)")
 
     print("\n  Top 20 most divisive:")
-    for _, r in res_df.head(20).iterrows():
-        print(f"    {r['resolution']}: Yes={r['yes']} No={r['no']} Abs={r['abstain']} "
-              f"NonYes={r['non_yes_pct']}% — {r['title'][:80]}")
+    for r in res_df.head(20).itertuples(index=False):
+        print(f"    {r.resolution}: Yes={r.yes} No={r.no} Abs={r.abstain} "
+              f"NonYes={r.non_yes_pct}% — {r.title[:80]}")
     return res_df
 
 
 # ═══════════════════════════════════════════════════════════════════════════
 # OUTPUT 11: Full Country Vote Profile 2025
 # ═══════════════════════════════════════════════════════════════════════════
-def output_11_country_vote_profile(annual):
+def output_11_country_vote_profile(annual_by_year):
     separator("11 — Country Vote Profile 2025")
-    d25 = annual[annual['Year'] == 2025].copy()
-    d25['yes_pct'] = (d25['Yes Votes'] / d25['Total Votes in Year'] * 100).round(1)
-    d25['no_pct'] = (d25['No Votes'] / d25['Total Votes in Year'] * 100).round(1)
-    d25['abstain_pct'] = (d25['Abstain Votes'] / d25['Total Votes in Year'] * 100).round(1)
-    d25['region'] = d25['Country name'].map(ISO3_TO_REGION)
-    d25['broad_region'] = d25['region'].map(SUBREGION_TO_BROAD)
+    d25 = with_regions(annual_by_year[2025], 'Country name')
     d25 = d25.sort_values('Pillar 1 Score', ascending=False)
 
     out = OUT_DIR / "11_p1_country_vote_profile_2025.csv"
     d25.to_csv(out, index=False)
     print(f"  ✓ Saved {out.name} ({len(d25)} countries)")
 
-    # Notable outliers
-    print(f"\n  P1=100 countries: {list(d25[d25['Pillar 1 Score'] == 100]['Country name'].values)}")
-    print(f"  P1=0 countries:   {list(d25[d25['Pillar 1 Score'] == 0]['Country name'].values)}")
-    print(f"  P1<20 countries:  {list(d25[d25['Pillar 1 Score'] < 20]['Country name'].values)}")
+    # Notable outliers: thresholds on the bare score array pick the names
+    # directly, without copying a filtered frame per threshold
+    p1 = d25['Pillar 1 Score'].to_numpy()
+    names = d25['Country name'].to_numpy()
+    print(f"\n  P1=100 countries: {list(names[p1 == 100])}")
+    print(f"  P1=0 countries:   {list(names[p1 == 0])}")
+    print(f"  P1<20 countries:  {list(names[p1 < 20])}")
     return d25
 
 
@@ -629,20 +883,20 @@ def output_12_leadership_candidates(shifts):
     separator("12 — Leadership Change Candidates")
     # Flag countries with large P1 change AND significant yes_pct change
     # (not just participation-driven)
-    df = shifts.dropna(subset=['p1_change', 'total_2024', 'total_2025']).copy()
+    df = shifts.dropna(subset=['p1_change', 'total_2024', 'total_2025'])
     # Filter to countries with reasonable participation in both years (>30 votes)
     df = df[(df['total_2024'] >= 30) & (df['total_2025'] >= 30)]
     # Large P1 change AND yes_pct changed significantly
-    candidates = df[(df['p1_change'].abs() > 10) & (df['yes_pct_change'].abs() > 5)].copy()
-    candidates['likely_driver'] = 'POLICY_SHIFT'
+    candidates = df[(df['p1_change'].abs() > 10) & (df['yes_pct_change'].abs() > 5)]
+    candidates = candidates.assign(likely_driver='POLICY_SHIFT')
     candidates = candidates.sort_values('p1_change')
 
     out = OUT_DIR / "12_p1_leadership_change_candidates.csv"
     candidates.to_csv(out, index=False)
     print(f"  ✓ Saved {out.name} ({len(candidates)} candidates)")
-    for _, r in candidates.iterrows():
-        print(f"    {r['iso3']}: P1 {r['p1_change']:+.1f}, Yes% {r['yes_pct_change']:+.1f}pp "
-              f"(votes: {int(r['total_2024'])}→{int(r['total_2025'])})")
+    for r in candidates.itertuples(index=False):
+        print(f"    {r.iso3}: P1 {r.p1_change:+.1f}, Yes% {r.yes_pct_change:+.1f}pp "
+              f"(votes: {int(r.total_2024)}→{int(r.total_2025)})")
     return candidates
 
 
@@ -651,20 +905,20 @@ def output_12_leadership_candidates(shifts):
 # ═══════════════════════════════════════════════════════════════════════════
 def output_13_spotty_voting(shifts):
     separator("13 — Spotty Voting Candidates")
-    df = shifts.dropna(subset=['total_2024', 'total_2025']).copy()
-    df['participation_change_pct'] = ((df['total_2025'] - df['total_2024']) / df['total_2024'] * 100).round(1)
+    df = shifts.dropna(subset=['total_2024', 'total_2025'])
+    df = df.assign(participation_change_pct=((df['total_2025'] - df['total_2024']) / df['total_2024'] * 100).round(1))
     # Countries where participation drove P1 change — low votes or big swing
     spotty = df[((df['total_2025'] < 50) | (df['total_2024'] < 50)) &
-                (df['p1_change'].abs() > 5)].copy()
-    spotty['driver'] = 'PARTICIPATION'
+                (df['p1_change'].abs() > 5)]
+    spotty = spotty.assign(driver='PARTICIPATION')
     spotty = spotty.sort_values('p1_change')
 
     out = OUT_DIR / "13_p1_spotty_voting_candidates.csv"
     spotty.to_csv(out, index=False)
     print(f"  ✓ Saved {out.name} ({len(spotty)} candidates)")
-    for _, r in spotty.iterrows():
-        print(f"    {r['iso3']}: P1 {r['p1_change']:+.1f}, votes {int(r['total_2024'])}→{int(r['total_2025'])} "
-              f"({r['participation_change_pct']:+.0f}%)")
+    for r in spotty.itertuples(index=False):
+        print(f"    {r.iso3}: P1 {r.p1_change:+.1f}, votes {int(r.total_2024)}→{int(r.total_2025)} "
+              f"({r.participation_change_pct:+.0f}%)")
     return spotty
 
 
@@ -680,37 +934,18 @@ def output_14_alliance_patterns(pairwise, shifts):
         'ISR': 'Israel',
     }
 
-    results = []
-    for anchor, bloc_name in BLOCS.items():
-        a24 = pairwise[(pairwise['Year'] == 2024) &
-                        ((pairwise['Country1_ISO3'] == anchor) | (pairwise['Country2_ISO3'] == anchor))].copy()
-        a25 = pairwise[(pairwise['Year'] == 2025) &
-                        ((pairwise['Country1_ISO3'] == anchor) | (pairwise['Country2_ISO3'] == anchor))].copy()
-
-        def get_partner(row):
-            return row['Country2_ISO3'] if row['Country1_ISO3'] == anchor else row['Country1_ISO3']
-
-        a24['partner'] = a24.apply(get_partner, axis=1)
-        a25['partner'] = a25.apply(get_partner, axis=1)
-        a24_s = a24[['partner', 'CosineSimilarity']].rename(columns={'CosineSimilarity': 'sim_2024'})
-        a25_s = a25[['partner', 'CosineSimilarity']].rename(columns={'CosineSimilarity': 'sim_2025'})
-        am = pd.merge(a24_s, a25_s, on='partner', how='inner')
-        am['sim_change'] = (am['sim_2025'] - am['sim_2024']).round(4)
-        am['bloc'] = bloc_name
-        am['anchor'] = anchor
-        results.append(am)
-
-    all_blocs = pd.concat(results)
+    # One (anchor, partner) × year matrix; keep partners present in both years
+    sims = anchor_similarity(pairwise, list(BLOCS)).dropna(subset=[2024, 2025])
+    sim_change = (sims[2025] - sims[2024]).round(4)
 
     # Pivot to wide format: one row per country, columns for each bloc's sim change
-    pivot = all_blocs.pivot_table(index='partner', columns='anchor',
-                                   values='sim_change', aggfunc='first').reset_index()
+    pivot = sim_change.unstack('anchor').reset_index()
     pivot.columns.name = None
     pivot.columns = ['iso3'] + [f'sim_change_vs_{c}' for c in pivot.columns[1:]]
 
     # Add p1 change
-    p1_chg = shifts[['iso3', 'p1_change', 'region', 'broad_region']].copy()
-    pivot = pd.merge(pivot, p1_chg, on='iso3', how='left')
+    p1_chg = shifts[['iso3', 'p1_change', 'region', 'broad_region']]
+    pivot = pd.merge(pivot, p1_chg, on='iso3', how='left', validate='one_to_one')
     pivot = pivot.sort_values('sim_change_vs_USA', ascending=True)
 
     out = OUT_DIR / "14_p1_alliance_pattern_shifts.csv"
@@ -718,19 +953,18 @@ def output_14_alliance_patterns(pairwise, shifts):
     print(f"  ✓ Saved {out.name} ({len(pivot)} countries)")
 
     # Summary: who moved TOWARD USA
+    away, toward = extreme_rows_both(pivot, 'sim_change_vs_USA', 10)
     print("\n  Top 10 moved TOWARD USA:")
-    toward = pivot.sort_values('sim_change_vs_USA', ascending=False).head(10)
-    for _, r in toward.iterrows():
-        usa_chg = r.get('sim_change_vs_USA', float('nan'))
-        chn_chg = r.get('sim_change_vs_CHN', float('nan'))
-        print(f"    {r['iso3']}: USA {usa_chg:+.3f}, CHN {chn_chg:+.3f}" if pd.notna(chn_chg) else f"    {r['iso3']}: USA {usa_chg:+.3f}")
+    for r in toward.itertuples(index=False):
+        usa_chg = getattr(r, 'sim_change_vs_USA', float('nan'))
+        chn_chg = getattr(r, 'sim_change_vs_CHN', float('nan'))
+        print(f"    {r.iso3}: USA {usa_chg:+.3f}, CHN {chn_chg:+.3f}" if pd.notna(chn_chg) else f"    {r.iso3}: USA {usa_chg:+.3f}")
 
     print("\n  Top 10 moved AWAY from USA:")
-    away = pivot.sort_values('sim_change_vs_USA', ascending=True).head(10)
-    for _, r in away.iterrows():
-        usa_chg = r.get('sim_change_vs_USA', float('nan'))
-        chn_chg = r.get('sim_change_vs_CHN', float('nan'))
-        print(f"    {r['iso3']}: USA {usa_chg:+.3f}, CHN {chn_chg:+.3f}" if pd.notna(chn_chg) else f"    {r['iso3']}: USA {usa_chg:+.3f}")
+    for r in away.itertuples(index=False):
+        usa_chg = getattr(r, 'sim_change_vs_USA', float('nan'))
+        chn_chg = getattr(r, 'sim_change_vs_CHN', float('nan'))
+        print(f"    {r.iso3}: USA {usa_chg:+.3f}, CHN {chn_chg:+.3f}" if pd.notna(chn_chg) else f"    {r.iso3}: USA {usa_chg:+.3f}")
     return pivot
 
 
@@ -742,21 +976,20 @@ def output_15_key_movers_topic_detail(topics, big_movers):
     KEY_COUNTRIES = ['USA', 'ARG', 'SYR', 'ISR', 'BRA', 'UKR', 'MMR', 'PRY', 'HUN',
                      'GBR', 'FRA', 'DEU', 'CAN', 'AUS', 'CHN', 'RUS', 'IND']
     # Also add all big movers
-    big_isos = list(big_movers['iso3'].unique())
-    all_targets = list(set(KEY_COUNTRIES + big_isos))
-
-    t24 = topics[(topics['Year'] == 2024) & (topics['Country'].isin(all_targets))].copy()
-    t25 = topics[(topics['Year'] == 2025) & (topics['Country'].isin(all_targets))].copy()
+    all_targets = np.union1d(KEY_COUNTRIES, big_movers['iso3'].to_numpy(dtype=str))
 
-    t24['yes_pct'] = (t24['YesVotes_Topic'] / t24['TotalVotes_Topic'] * 100).round(1)
-    t25['yes_pct'] = (t25['YesVotes_Topic'] / t25['TotalVotes_Topic'] * 100).round(1)
+    # Filter both years and derive yes_pct in one pass, then split by year
+    sel = topics[topics['Year'].isin([2024, 2025]) & topics['Country'].isin(all_targets)]
+    sel = sel.assign(yes_pct=(sel['YesVotes_Topic'] / sel['TotalVotes_Topic'] * 100).round(1))
+    t24 = sel[sel['Year'] == 2024]
+    t25 = sel[sel['Year'] == 2025]
 
     t24_s = t24[['Country', 'TopicTag', 'yes_pct', 'TotalVotes_Topic']].rename(
         columns={'yes_pct': 'yes_pct_2024', 'TotalVotes_Topic': 'votes_2024'})
     t25_s = t25[['Country', 'TopicTag', 'yes_pct', 'TotalVotes_Topic']].rename(
         columns={'yes_pct': 'yes_pct_2025', 'TotalVotes_Topic': 'votes_2025'})
 
-    merged = pd.merge(t24_s, t25_s, on=['Country', 'TopicTag'], how='outer')
+    merged = pd.merge(t24_s, t25_s, on=['Country', 'TopicTag'], how='outer', validate='one_to_one')
     merged['yes_pct_change'] = (merged['yes_pct_2025'] - merged['yes_pct_2024']).round(1)
     merged = merged.sort_values(['Country', 'yes_pct_change'])
 
@@ -767,8 +1000,8 @@ def output_15_key_movers_topic_detail(topics, big_movers):
     # Show USA specifically
     usa = merged[merged['Country'] == 'USA'].dropna(subset=['yes_pct_2024', 'yes_pct_2025'])
     print("\n  USA topic shifts (present in both years):")
-    for _, r in usa.sort_values('yes_pct_change').iterrows():
-        print(f"    {r['TopicTag']}: {r['yes_pct_change']:+.1f}pp ({r['yes_pct_2024']:.0f}% → {r['yes_pct_2025']:.0f}%)")
+    for r in usa.sort_values('yes_pct_change').itertuples(index=False):
+        print(f"    {r.TopicTag}: {r.yes_pct_change:+.1f}pp ({r.yes_pct_2024:.0f}% → {r.yes_pct_2025:.0f}%)")
     return merged
 
 
@@ -781,10 +1014,10 @@ def output_16_key_country_p1_history(annual):
            'IND', 'FRA', 'DEU', 'JPN', 'AUS', 'CAN', 'ZAF', 'NGA', 'EGY',
            'SAU', 'TUR', 'MEX', 'PRY', 'HUN']
     df = annual[(annual['Year'] >= 2015) & (annual['Year'] <= 2025) &
-                (annual['Country name'].isin(KEY))].copy()
+                (annual['Country name'].isin(KEY))]
     df = df[['Country name', 'Year', 'Pillar 1 Score', 'Yes Votes', 'No Votes',
-             'Abstain Votes', 'Total Votes in Year']].copy()
-    df.columns = ['iso3', 'year', 'p1_score', 'yes', 'no', 'abstain', 'total']
+             'Abstain Votes', 'Total Votes in Year']]
+    df = df.set_axis(['iso3', 'year', 'p1_score', 'yes', 'no', 'abstain', 'total'], axis=1)
     df = df.sort_values(['iso3', 'year'])
 
     out = OUT_DIR / "16_p1_key_country_history.csv"
@@ -800,49 +1033,69 @@ def output_17_resolution_vote_detail(raw_votes):
     separator("17 — Resolution-Level Vote Detail for Key Countries (2025)")
     KEY = ['USA', 'ARG', 'ISR', 'SYR', 'PRY', 'BRA', 'GBR', 'CHN', 'RUS', 'UKR']
 
-    df = raw_votes.copy()
-    df['Date'] = pd.to_datetime(df['Date'], format='mixed', utc=True)
-    df['Year'] = df['Date'].dt.year
-    ga25 = df[(df['Year'] == 2025) & (df['sc_flag'] == 0)]
-
-    rows = []
-    for _, res in ga25.iterrows():
-        try:
-            votes = json.loads(res['vote_data'])
-        except (json.JSONDecodeError, TypeError):
-            continue
-        for iso3 in KEY:
-            vote = votes.get(iso3)
-            rows.append({
-                'resolution': res['Resolution'],
-                'title': res['Title'][:100],
-                'date': res['Date'].strftime('%Y-%m-%d'),
-                'iso3': iso3,
-                'vote': vote if vote else 'ABSENT',
-                'tags': res['tags']
-            })
-
-    detail = pd.DataFrame(rows)
+    ga25 = select_ga_resolutions(raw_votes, 2025)
+
+    ga25, parsed, countries, codes = build_vote_matrix(ga25)
+    iso_index = {iso: i for i, iso in enumerate(countries)}
+    n_res = len(ga25)
+    # Per-country YES / NO / ABSTAIN totals from the bit planes, packed per country
+    totals = np.column_stack(count_vote_planes(*pack_vote_planes(codes.T)))
+    key_codes = np.zeros((n_res, len(KEY)), dtype=np.int8)
+    for j, iso3 in enumerate(KEY):
+        if iso3 in iso_index:
+            key_codes[:, j] = codes[:, iso_index[iso3]]
+    # Code 0 covers both missing and unrecognised votes; put the raw value back
+    # for the latter so the detail keeps what vote_data actually recorded
+    labels = VOTE_LABELS[key_codes].astype(object)
+    for i, j in np.argwhere(key_codes == 0):
+        vote = parsed[i].get(KEY[j])
+        if vote:
+            labels[i, j] = vote
+
+    detail = pd.DataFrame({
+        'resolution': np.repeat(ga25['Resolution'].to_numpy(), len(KEY)),
+        'title': np.repeat(ga25['Title'].str[:100].to_numpy(), len(KEY)),
+        'date': np.repeat(iso_dates(ga25['Date']), len(KEY)),
+        'iso3': np.tile(KEY, n_res),
+        'vote': labels.ravel(),
+        'tags': np.repeat(ga25['tags'].to_numpy(), len(KEY)),
+    })
     out = OUT_DIR / "17_p1_resolution_vote_detail_2025.csv"
     detail.to_csv(out, index=False)
     print(f"  ✓ Saved {out.name} ({len(detail)} rows)")
 
-    # Summary per country
-    for iso3 in KEY:
-        sub = detail[detail['iso3'] == iso3]
-        counts = sub['vote'].value_counts()
-        print(f"    {iso3}: " + ", ".join(f"{k}={v}" for k, v in counts.items()))
+    # Summary per country: YES / NO / ABSTAIN from the precomputed totals, the
+    # rest (ABSENT and any unrecognised value) from the code-0 cells' labels
+    for j, iso3 in enumerate(KEY):
+        row = totals[iso_index[iso3]] if iso3 in iso_index else np.zeros(3, dtype=np.int64)
+        rest, rest_counts = np.unique([str(v) for v in labels[key_codes[:, j] == 0, j]],
+                                      return_counts=True)
+        # A handful of labels: a plain stable sort, no per-country Series
+        counts = sorted(((label, int(n)) for label, n in
+                         zip([*VOTE_LABELS[1:], *rest], [*row, *rest_counts]) if n > 0),
+                        key=lambda kv: kv[1], reverse=True)
+        print(f"    {iso3}: " + ", ".join(f"{k}={v}" for k, v in counts))
     return detail
 
 
 # ═══════════════════════════════════════════════════════════════════════════
 # VOTE ARITHMETIC VALIDATION
 # ═══════════════════════════════════════════════════════════════════════════
-def validate_vote_arithmetic(annual):
+def vote_sum_mismatches(df):
+    """Rows of df whose Yes + No + Abstain differs from the total, plus that sum.
+
+    The check runs on the bare count arrays; only failing rows are copied out
+    of the frame, instead of assigning a sum column across the whole year.
+    """
+    vote_sum = (df['Yes Votes'].to_numpy() + df['No Votes'].to_numpy()
+                + df['Abstain Votes'].to_numpy())
+    bad = vote_sum != df['Total Votes in Year'].to_numpy()
+    return df[bad].assign(sum=vote_sum[bad])
+
+
+def validate_vote_arithmetic(annual_by_year):
     separator("VALIDATION — Vote Arithmetic")
-    d25 = annual[annual['Year'] == 2025].copy()
-    d25['sum'] = d25['Yes Votes'] + d25['No Votes'] + d25['Abstain Votes']
-    mismatches = d25[d25['sum'] != d25['Total Votes in Year']]
+    mismatches = vote_sum_mismatches(annual_by_year[2025])
     if len(mismatches) == 0:
         print("  ✓ Vote arithmetic (Yes + No + Abstain == Total) passes for all 2025 rows")
     else:
@@ -850,9 +1103,7 @@ def validate_vote_arithmetic(annual):
         print(mismatches[['Country name', 'Yes Votes', 'No Votes', 'Abstain Votes', 'Total Votes in Year', 'sum']])
 
     # Check 2024 too
-    d24 = annual[annual['Year'] == 2024].copy()
-    d24['sum'] = d24['Yes Votes'] + d24['No Votes'] + d24['Abstain Votes']
-    mismatches24 = d24[d24['sum'] != d24['Total Votes in Year']]
+    mismatches24 = vote_sum_mismatches(annual_by_year[2024])
     if len(mismatches24) == 0:
         print("  ✓ Vote arithmetic passes for all 2024 rows")
     else:
@@ -864,22 +1115,34 @@ def validate_vote_arithmetic(annual):
 # ═══════════════════════════════════════════════════════════════════════════
 def main():
     annual, pairwise, topics, raw_votes = load_data()
+    # Split out only the 2024/2025 rows the year-specific outputs index into,
+    # and derive the vote shares outputs 02 and 11 read on those rows alone
+    # rather than on every year of annual_scores
+    annual_by_year = {}
+    for year, df in annual[annual['Year'].isin([2024, 2025])].groupby('Year'):
+        total = df['Total Votes in Year']
+        annual_by_year[year] = df.assign(
+            yes_pct=(df['Yes Votes'] / total * 100).round(1),
+            no_pct=(df['No Votes'] / total * 100).round(1),
+            abstain_pct=(df['Abstain Votes'] / total * 100).round(1),
+        )
 
     # Validate first
-    validate_vote_arithmetic(annual)
+    validate_vote_arithmetic(annual_by_year)
 
     # Core outputs
     trend = output_01_world_avg_trend(annual)
-    shifts = output_02_country_shifts(annual)
+    shifts = output_02_country_shifts(annual_by_year)
     big_movers = output_03_big_movers(shifts)
     participation = output_04_participation(shifts)
-    topic_changes = output_05_topic_changes(topics)
-    new_dropped = output_06_topic_new_dropped(topics)
+    topic_totals = topic_year_totals(topics)
+    topic_changes = output_05_topic_changes(topic_totals)
+    new_dropped = output_06_topic_new_dropped(topic_totals)
     pairwise_shifts = output_07_pairwise_shifts(pairwise)
     us_alliances = output_08_us_alliance_shifts(pairwise)
-    regional = output_09_regional(annual)
+    regional = output_09_regional(annual_by_year)
     divisive = output_10_divisive_resolutions(raw_votes)
-    profile = output_11_country_vote_profile(annual)
+    profile = output_11_country_vote_profile(annual_by_year)
     leadership = output_12_leadership_candidates(shifts)
     spotty = output_13_spotty_voting(shifts)
     alliance_patterns = output_14_alliance_patterns(pairwise, shifts)
@@ -898,7 +1161,10 @@ def main():
     p1_25 = trend.loc[trend['Year'] == 2025, 'world_avg_p1'].values[0]
     print(f"  • World avg P1: {p1_24:.2f} → {p1_25:.2f} ({p1_25-p1_24:+.2f})")
     print(f"  • Big movers (>10pt): {len(big_movers)} countries")
-    print(f"  • Topics in 2025: {topics[topics['Year']==2025]['TopicTag'].nunique()} (vs {topics[topics['Year']==2024]['TopicTag'].nunique()} in 2024)")
+    # Distinct tags per year are the group counts of topic_totals, not a fresh
+    # mask-and-nunique over the whole topic table for each year
+    n_tags = topic_totals.groupby(level='Year').size()
+    print(f"  • Topics in 2025: {n_tags.get(2025, 0)} (vs {n_tags.get(2024, 0)} in 2024)")
 
 
 if __name__ == "__main__":
@@ -257,6 +257,10 @@ SUBREGION_TO_BROAD = {
     "Polynesia": "Oceania",
 }
 
+ISO3_TO_REGIONS = {
+    iso3: (region, SUBREGION_TO_BROAD.get(region, "")) for iso3, region in ISO3_TO_REGION.items()
+}
+
 
 def round_or_blank(value: float | None, digits: int = 2):
     if value is None:
@@ -307,7 +311,7 @@ def load_annual_scores():
         for row in reader:
             iso3 = row["Country name"]
             year = int(row["Year"])
-            region = ISO3_TO_REGION.get(iso3, "")
+            region, broad_region = ISO3_TO_REGIONS.get(iso3, ("", ""))
             rows.append(
                 {
                     "iso3": iso3,
@@ -324,7 +328,7 @@ def load_annual_scores():
                     "abstain": int(float(row["Abstain Votes"])) if row["Abstain Votes"] else 0,
                     "total": int(float(row["Total Votes in Year"])) if row["Total Votes in Year"] else 0,
                     "region": region,
-                    "broad_region": SUBREGION_TO_BROAD.get(region, ""),
+                    "broad_region": broad_region,
                 }
             )
     return rows
@@ -363,7 +367,7 @@ def output_01_world_avg_trend(rows):
                 "Year": year,
                 "world_avg_p2": round_or_blank(current),
                 "median_p2": round_or_blank(median(vals)),
-                "std_p2": round_or_blank(pstdev(vals)),
+                "std_p2": round_or_blank(pstdev(vals, current)),
                 "num_countries": len(vals),
                 "avg_total_votes": round_or_blank(mean(totals[year]), 1),
                 "yoy_change": round_or_blank(yoy),
@@ -503,19 +507,21 @@ def output_04_region_summaries(rows):
 
 
 def output_05_region_outliers_2025(rows):
-    broad_avg = {}
-    sub_avg = {}
-    for broad in {row["broad_region"] for row in rows if row["year"] == 2025 and row["broad_region"]}:
-        vals = [row["p2"] for row in rows if row["year"] == 2025 and row["broad_region"] == broad and row["p2"] is not None]
-        broad_avg[broad] = mean(vals)
-    for sub in {row["region"] for row in rows if row["year"] == 2025 and row["region"]}:
-        vals = [row["p2"] for row in rows if row["year"] == 2025 and row["region"] == sub and row["p2"] is not None]
-        sub_avg[sub] = mean(vals)
+    # Bucket the 2025 scores by region in one pass instead of rescanning every
+    # row once per broad region and once per subregion
+    rows_2025 = [row for row in rows if row["year"] == 2025 and row["p2"] is not None]
+    broad_vals = defaultdict(list)
+    sub_vals = defaultdict(list)
+    for row in rows_2025:
+        if row["broad_region"]:
+            broad_vals[row["broad_region"]].append(row["p2"])
+        if row["region"]:
+            sub_vals[row["region"]].append(row["p2"])
+    broad_avg = {broad: mean(vals) for broad, vals in broad_vals.items()}
+    sub_avg = {sub: mean(vals) for sub, vals in sub_vals.items()}
 
     out = []
-    for row in rows:
-        if row["year"] != 2025 or row["p2"] is None:
-            continue
+    for row in rows_2025:
         out.append(
             {
                 "iso3": row["iso3"],
@@ -643,12 +649,13 @@ def output_09_distribution_summary(rows):
     out = []
     for year in (2024, 2025):
         vals = sorted(row["p2"] for row in rows if row["year"] == year and row["p2"] is not None)
+        avg = mean(vals)
         out.append(
             {
                 "year": year,
-                "mean_p2": round_or_blank(mean(vals)),
+                "mean_p2": round_or_blank(avg),
                 "median_p2": round_or_blank(median(vals)),
-                "std_p2": round_or_blank(pstdev(vals)),
+                "std_p2": round_or_blank(pstdev(vals, avg)),
                 "min_p2": round_or_blank(vals[0] if vals else None),
                 "p10": round_or_blank(percentile(vals, 0.10)),
                 "p25": round_or_blank(percentile(vals, 0.25)),
@@ -269,6 +269,10 @@ SUBREGION_TO_BROAD = {
     "Polynesia": "Oceania",
 }
 
+ISO3_TO_REGIONS = {
+    iso3: (region, SUBREGION_TO_BROAD.get(region, "")) for iso3, region in ISO3_TO_REGION.items()
+}
+
 
 def round_or_blank(value: float | None, digits: int = 2):
     if value is None:
@@ -329,7 +333,7 @@ def load_annual_scores():
         for row in reader:
             iso3 = row["Country name"]
             year = int(row["Year"])
-            region = ISO3_TO_REGION.get(iso3, "")
+            region, broad_region = ISO3_TO_REGIONS.get(iso3, ("", ""))
             rows.append(
                 {
                     "iso3": iso3,
@@ -349,28 +353,41 @@ def load_annual_scores():
                     if row["Total Votes in Year"]
                     else 0,
                     "region": region,
-                    "broad_region": SUBREGION_TO_BROAD.get(region, ""),
+                    "broad_region": broad_region,
                 }
             )
     return rows
 
 
-def load_topic_votes():
+def load_topic_votes(years=(2024, 2025)):
+    # Outputs 06 and 08 only compare 2024 with 2025, so other years are
+    # dropped on the parsed Year instead of being built into dicts and skipped
+    # later. csv.reader plus header positions keeps quoted fields (and any
+    # newlines inside them) intact without a dict per row of the other years.
     rows = []
     with open(DATA_DIR / "topic_votes_yearly (4).csv", newline="") as handle:
-        reader = csv.DictReader(handle)
+        reader = csv.reader(handle)
+        header = next(reader)
+        year_idx = header.index("Year")
+        country_idx = header.index("Country")
+        topic_idx = header.index("TopicTag")
+        yes_idx = header.index("YesVotes_Topic")
+        no_idx = header.index("NoVotes_Topic")
+        abstain_idx = header.index("AbstainVotes_Topic")
+        total_idx = header.index("TotalVotes_Topic")
         for row in reader:
+            year = int(row[year_idx])
+            if year not in years:
+                continue
             rows.append(
                 {
-                    "year": int(row["Year"]),
-                    "country": row["Country"],
-                    "topic": row["TopicTag"],
-                    "yes": int(row["YesVotes_Topic"]) if row["YesVotes_Topic"] else 0,
-                    "no": int(row["NoVotes_Topic"]) if row["NoVotes_Topic"] else 0,
-                    "abstain": int(row["AbstainVotes_Topic"])
-                    if row["AbstainVotes_Topic"]
-                    else 0,
-                    "total": int(row["TotalVotes_Topic"]) if row["TotalVotes_Topic"] else 0,
+                    "year": year,
+                    "country": row[country_idx],
+                    "topic": row[topic_idx],
+                    "yes": int(row[yes_idx]) if row[yes_idx] else 0,
+                    "no": int(row[no_idx]) if row[no_idx] else 0,
+                    "abstain": int(row[abstain_idx]) if row[abstain_idx] else 0,
+                    "total": int(row[total_idx]) if row[total_idx] else 0,
                 }
             )
     return rows
@@ -403,9 +420,16 @@ def load_raw_resolutions():
             except json.JSONDecodeError:
                 continue
 
-            yes = sum(1 for vote in votes.values() if vote == "YES")
-            no = sum(1 for vote in votes.values() if vote == "NO")
-            abstain = sum(1 for vote in votes.values() if vote == "ABSTAIN")
+            # One counting pass over the ~193 country votes instead of three;
+            # plain equality, so a malformed (unhashable) vote value is skipped
+            yes = no = abstain = 0
+            for vote in votes.values():
+                if vote == "YES":
+                    yes += 1
+                elif vote == "NO":
+                    no += 1
+                elif vote == "ABSTAIN":
+                    abstain += 1
             total = yes + no + abstain
             if total == 0:
                 continue
@@ -459,7 +483,7 @@ def output_01_world_avg_trend(rows):
                 "Year": year,
                 "world_avg_p3": round_or_blank(current),
                 "median_p3": round_or_blank(median(vals)),
-                "std_p3": round_or_blank(pstdev(vals)),
+                "std_p3": round_or_blank(pstdev(vals, current)),
                 "num_countries": len(vals),
                 "avg_total_votes": round_or_blank(mean(totals[year]), 1),
                 "yoy_change": round_or_blank(yoy),
@@ -637,18 +661,23 @@ def output_05_majority_alignment_proxy(raw_resolutions, annual_rows):
         world_mix[year]["abstain"] += row["abstain"]
         world_mix[year]["total"] += row["total"]
 
+        # Inner loop runs once per (resolution, country); the majority is read
+        # once per resolution. Votes are matched by equality, not hashed, so a
+        # malformed vote value is skipped rather than raising
+        majority = row["majority_vote"]
         for iso3, vote in row["votes"].items():
-            if vote not in ("YES", "NO", "ABSTAIN"):
-                continue
-            item = country_year[(iso3, year)]
-            item["participated"] += 1
             if vote == "YES":
-                item["yes"] += 1
+                field = "yes"
             elif vote == "NO":
-                item["no"] += 1
+                field = "no"
+            elif vote == "ABSTAIN":
+                field = "abstain"
             else:
-                item["abstain"] += 1
-            if row["majority_vote"] and vote == row["majority_vote"]:
+                continue
+            item = country_year[(iso3, year)]
+            item["participated"] += 1
+            item[field] += 1
+            if vote == majority:
                 item["with_majority"] += 1
 
     annual_map = {(row["iso3"], row["year"]): row for row in annual_rows if row["year"] in (2024, 2025)}
@@ -965,12 +994,13 @@ def output_10_distribution_summary(rows):
     out = []
     for year in (2024, 2025):
         vals = sorted(row["p3"] for row in rows if row["year"] == year and row["p3"] is not None)
+        avg = mean(vals)
         out.append(
             {
                 "year": year,
-                "mean_p3": round_or_blank(mean(vals)),
+                "mean_p3": round_or_blank(avg),
                 "median_p3": round_or_blank(median(vals)),
-                "std_p3": round_or_blank(pstdev(vals)),
+                "std_p3": round_or_blank(pstdev(vals, avg)),
                 "min_p3": round_or_blank(vals[0] if vals else None),
                 "p10": round_or_blank(percentile(vals, 0.10)),
                 "p25": round_or_blank(percentile(vals, 0.25)),
@@ -1030,21 +1060,19 @@ def output_11_key_country_history(rows):
 
 def output_12_global_outliers_2025(rows, proxy_rows):
     proxy_map = {row["iso3"]: row for row in proxy_rows}
-    world_avg = mean(row["p3"] for row in rows if row["year"] == 2025 and row["p3"] is not None)
+    # One pass over the 2025 scores feeds both the world and the broad-region
+    # averages, instead of rescanning every row once per broad region
+    rows_2025 = [row for row in rows if row["year"] == 2025 and row["p3"] is not None]
+    world_avg = mean(row["p3"] for row in rows_2025)
 
-    broad_avg = {}
-    for broad_region in {row["broad_region"] for row in rows if row["year"] == 2025 and row["broad_region"]}:
-        vals = [
-            row["p3"]
-            for row in rows
-            if row["year"] == 2025 and row["broad_region"] == broad_region and row["p3"] is not None
-        ]
-        broad_avg[broad_region] = mean(vals)
+    broad_vals = defaultdict(list)
+    for row in rows_2025:
+        if row["broad_region"]:
+            broad_vals[row["broad_region"]].append(row["p3"])
+    broad_avg = {broad_region: mean(vals) for broad_region, vals in broad_vals.items()}
 
     out = []
-    for row in rows:
-        if row["year"] != 2025 or row["p3"] is None:
-            continue
+    for row in rows_2025:
         proxy = proxy_map.get(row["iso3"], {})
         out.append(
             {
@@ -36,46 +36,61 @@ def normalize(text: str) -> str:
 
 
 def tokenize_label(label: str) -> tuple[str, ...]:
-    return tuple(normalize(part) for part in label.split(",") if normalize(part))
+    return tuple(token for token in map(normalize, label.split(",")) if token)
+
+
+Candidates = dict[str, list[tuple[tuple[str, ...], str]]]
+
+
+def by_first_token(candidates: list[tuple[tuple[str, ...], str]]) -> Candidates:
+    # A candidate can only match where its first token does, so bucketing on it
+    # turns every lookup into one dict hit; each bucket keeps the sorted order
+    buckets: Candidates = defaultdict(list)
+    for token_parts, label in candidates:
+        buckets[token_parts[0]].append((token_parts, label))
+    return dict(buckets)
 
 
 class TaxonomyParser:
     def __init__(self) -> None:
-        self.l1_candidates: list[tuple[tuple[str, ...], str]] = []
-        self.l2_by_l1: dict[str, list[tuple[tuple[str, ...], str]]] = {}
-        self.l3_by_pair: dict[tuple[str, str], list[tuple[tuple[str, ...], str]]] = {}
+        l1_candidates: list[tuple[tuple[str, ...], str]] = []
+        self.l2_by_l1: dict[str, Candidates] = {}
+        self.l3_by_pair: dict[tuple[str, str], Candidates] = {}
 
         for topic_l1, l2_map in un_classification.items():
-            self.l1_candidates.append((tokenize_label(topic_l1), topic_l1))
+            l1_candidates.append((tokenize_label(topic_l1), topic_l1))
 
             l2_candidates: list[tuple[tuple[str, ...], str]] = []
             for topic_l2, l3_values in l2_map.items():
                 l2_candidates.append((tokenize_label(topic_l2), topic_l2))
-                self.l3_by_pair[(topic_l1, topic_l2)] = [
-                    (tokenize_label(topic_l3), topic_l3) for topic_l3 in l3_values
-                ]
+                self.l3_by_pair[(topic_l1, topic_l2)] = by_first_token(
+                    sorted(
+                        ((tokenize_label(topic_l3), topic_l3) for topic_l3 in l3_values),
+                        key=lambda item: (-len(item[0]), item[1]),
+                    )
+                )
 
-            self.l2_by_l1[topic_l1] = sorted(
-                l2_candidates,
-                key=lambda item: (-len(item[0]), item[1]),
+            self.l2_by_l1[topic_l1] = by_first_token(
+                sorted(
+                    l2_candidates,
+                    key=lambda item: (-len(item[0]), item[1]),
+                )
             )
 
-        self.l1_candidates.sort(key=lambda item: (-len(item[0]), item[1]))
-
-        for key, candidates in self.l3_by_pair.items():
-            self.l3_by_pair[key] = sorted(
-                candidates,
-                key=lambda item: (-len(item[0]), item[1]),
-            )
+        self.l1_candidates = by_first_token(
+            sorted(l1_candidates, key=lambda item: (-len(item[0]), item[1]))
+        )
 
     @staticmethod
     def _matching_candidates(
         tokens: tuple[str, ...],
         start: int,
-        candidates: list[tuple[tuple[str, ...], str]],
+        candidates: Candidates,
     ) -> list[tuple[tuple[str, ...], str]]:
         matches: list[tuple[tuple[str, ...], str]] = []
-        for token_parts, label in candidates:
+        if start >= len(tokens):
+            return matches
+        for token_parts, label in candidates.get(tokens[start], ()):
             stop = start + len(token_parts)
             if tokens[start:stop] == token_parts:
                 matches.append((token_parts, label))
@@ -169,7 +184,7 @@ class TaxonomyParser:
         if not raw_tags or not raw_tags.strip():
             return ()
 
-        tokens = tuple(normalize(part) for part in raw_tags.split(",") if normalize(part))
+        tokens = tokenize_label(raw_tags)
 
         parsed = self._parse_tokens(tokens, allow_unknown_l3=False)
         if parsed is not None:
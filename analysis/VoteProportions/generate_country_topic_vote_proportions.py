@@ -26,6 +26,13 @@ DEFAULT_END_YEAR = 2025
 DEFAULT_SC_FLAG = "0"
 DEFAULT_LEVELS = ("topic_l1", "topic_l2", "topic_l3")
 VOTE_VALUES = ("YES", "ABSTAIN", "NO")
+COUNT_METRICS = (
+    "resolution_count",
+    "recorded_vote_count",
+    "not_recorded_count",
+    "country_missing_count",
+    "unknown_vote_count",
+)
 
 
 def parse_year(date_value: str) -> int | None:
@@ -70,15 +77,28 @@ def read_country_yearly_topic_counts(
     diagnostics: Counter[str] = Counter()
 
     with input_path.open(newline="", encoding="utf-8-sig") as handle:
-        reader = csv.DictReader(handle)
+        # Plain csv.reader plus header positions: only five of the columns are
+        # read, so there is no need to build a dict for every row
+        reader = csv.reader(handle)
+        header = next(reader)
+        sc_flag_idx = header.index("sc_flag")
+        date_idx = header.index("Date")
+        tags_idx = header.index("tags")
+        resolution_idx = header.index("Resolution")
+        vote_data_idx = header.index("vote_data")
+        row_width = max(sc_flag_idx, date_idx, tags_idx, resolution_idx, vote_data_idx) + 1
         for row in reader:
             diagnostics["input_rows"] += 1
+            # csv.reader yields blank lines as [] and keeps ragged rows short
+            if len(row) < row_width:
+                diagnostics["skipped_short_row"] += 1
+                continue
 
-            if str(row.get("sc_flag", "")).strip() != sc_flag:
+            if row[sc_flag_idx].strip() != sc_flag:
                 diagnostics["skipped_sc_flag"] += 1
                 continue
 
-            year = parse_year(row.get("Date", ""))
+            year = parse_year(row[date_idx])
             if year is None:
                 diagnostics["skipped_bad_date"] += 1
                 continue
@@ -88,7 +108,7 @@ def read_country_yearly_topic_counts(
 
             diagnostics["included_rows"] += 1
 
-            raw_tags = row.get("tags", "") or ""
+            raw_tags = row[tags_idx]
             parsed_paths = parser.parse(raw_tags)
             unique_topics = {
                 level: {
@@ -101,9 +121,9 @@ def read_country_yearly_topic_counts(
             if not any(unique_topics.values()):
                 diagnostics["empty_tag_rows"] += 1
 
-            resolution = row.get("Resolution", "")
+            resolution = row[resolution_idx]
             try:
-                vote_data: Any = json.loads(row.get("vote_data", ""))
+                vote_data: Any = json.loads(row[vote_data_idx])
             except json.JSONDecodeError as exc:
                 raise ValueError(f"Invalid vote_data JSON for {resolution}") from exc
             if not isinstance(vote_data, dict):
@@ -114,22 +134,24 @@ def read_country_yearly_topic_counts(
                     topics_by_level[level].add(topic)
 
             for country in country_set:
+                # Classify the country's vote once; every topic it is counted
+                # under gets the same bucket
+                if country not in vote_data:
+                    bucket = "country_missing_count"
+                else:
+                    vote = vote_data[country]
+                    if vote in VOTE_VALUES:
+                        bucket = vote
+                    elif vote is None:
+                        bucket = "not_recorded_count"
+                    else:
+                        bucket = "unknown_vote_count"
+
                 for level in levels:
                     for topic in unique_topics[level]:
                         counts = counts_by_level[level][(country, year, topic)]
                         counts["resolution_count"] += 1
-
-                        if country not in vote_data:
-                            counts["country_missing_count"] += 1
-                            continue
-
-                        vote = vote_data[country]
-                        if vote in VOTE_VALUES:
-                            counts[vote] += 1
-                        elif vote is None:
-                            counts["not_recorded_count"] += 1
-                        else:
-                            counts["unknown_vote_count"] += 1
+                        counts[bucket] += 1
 
     return counts_by_level, topics_by_level, diagnostics
 
@@ -203,38 +225,31 @@ def build_change_rows_for_level(
 ) -> tuple[list[str], list[dict[str, int | str]]]:
     start_prefix = str(start_year)
     end_prefix = str(end_year)
-    fieldnames = [
-        "country",
-        topic_field,
-        "status",
-        f"{start_prefix}_resolution_count",
-        f"{end_prefix}_resolution_count",
-        "resolution_count_change",
-        f"{start_prefix}_recorded_vote_count",
-        f"{end_prefix}_recorded_vote_count",
-        "recorded_vote_count_change",
-        f"{start_prefix}_not_recorded_count",
-        f"{end_prefix}_not_recorded_count",
-        "not_recorded_count_change",
-        f"{start_prefix}_country_missing_count",
-        f"{end_prefix}_country_missing_count",
-        "country_missing_count_change",
-        f"{start_prefix}_unknown_vote_count",
-        f"{end_prefix}_unknown_vote_count",
-        "unknown_vote_count_change",
+    # Column names are fixed for the whole level: build them once, then every
+    # row just unpacks these tuples instead of re-formatting ~30 keys.
+    count_specs = [
+        (metric, f"{start_prefix}_{metric}", f"{end_prefix}_{metric}", f"{metric}_change")
+        for metric in COUNT_METRICS
     ]
-
-    for vote in ("yes", "abstain", "no"):
-        fieldnames.extend(
-            [
-                f"{start_prefix}_{vote}_count",
-                f"{end_prefix}_{vote}_count",
-                f"{vote}_count_change",
-                f"{start_prefix}_{vote}_pct",
-                f"{end_prefix}_{vote}_pct",
-                f"{vote}_pct_change_pp",
-            ]
+    vote_specs = [
+        (
+            f"{vote}_count",
+            f"{start_prefix}_{vote}_count",
+            f"{end_prefix}_{vote}_count",
+            f"{vote}_count_change",
+            f"{vote}_pct",
+            f"{start_prefix}_{vote}_pct",
+            f"{end_prefix}_{vote}_pct",
+            f"{vote}_pct_change_pp",
         )
+        for vote in ("yes", "abstain", "no")
+    ]
+
+    fieldnames = ["country", topic_field, "status"]
+    for _, start_field, end_field, change_field in count_specs:
+        fieldnames.extend([start_field, end_field, change_field])
+    for _, start_count, end_count, count_change, _, start_pct, end_pct, pct_change in vote_specs:
+        fieldnames.extend([start_count, end_count, count_change, start_pct, end_pct, pct_change])
     fieldnames.append("abs_yes_pct_change_pp")
 
     rows: list[dict[str, int | str]] = []
@@ -257,75 +272,49 @@ def build_change_rows_for_level(
             if status == "ABSENT_IN_BOTH":
                 continue
 
-            start_yes_pct = start_metrics["yes_pct"]
-            end_yes_pct = end_metrics["yes_pct"]
-            start_abstain_pct = start_metrics["abstain_pct"]
-            end_abstain_pct = end_metrics["abstain_pct"]
-            start_no_pct = start_metrics["no_pct"]
-            end_no_pct = end_metrics["no_pct"]
-
-            yes_pct_change = None
-            if start_yes_pct is not None and end_yes_pct is not None:
-                yes_pct_change = end_yes_pct - start_yes_pct
-
-            abstain_pct_change = None
-            if start_abstain_pct is not None and end_abstain_pct is not None:
-                abstain_pct_change = end_abstain_pct - start_abstain_pct
-
-            no_pct_change = None
-            if start_no_pct is not None and end_no_pct is not None:
-                no_pct_change = end_no_pct - start_no_pct
-
             row: dict[str, int | str] = {
                 "country": country,
                 topic_field: topic,
                 "status": status,
-                f"{start_prefix}_resolution_count": start_resolution_count,
-                f"{end_prefix}_resolution_count": end_resolution_count,
-                "resolution_count_change": end_resolution_count - start_resolution_count,
-                f"{start_prefix}_recorded_vote_count": int(start_metrics["recorded_vote_count"]),
-                f"{end_prefix}_recorded_vote_count": int(end_metrics["recorded_vote_count"]),
-                "recorded_vote_count_change": int(end_metrics["recorded_vote_count"])
-                - int(start_metrics["recorded_vote_count"]),
-                f"{start_prefix}_not_recorded_count": int(start_metrics["not_recorded_count"]),
-                f"{end_prefix}_not_recorded_count": int(end_metrics["not_recorded_count"]),
-                "not_recorded_count_change": int(end_metrics["not_recorded_count"])
-                - int(start_metrics["not_recorded_count"]),
-                f"{start_prefix}_country_missing_count": int(
-                    start_metrics["country_missing_count"]
-                ),
-                f"{end_prefix}_country_missing_count": int(
-                    end_metrics["country_missing_count"]
-                ),
-                "country_missing_count_change": int(end_metrics["country_missing_count"])
-                - int(start_metrics["country_missing_count"]),
-                f"{start_prefix}_unknown_vote_count": int(start_metrics["unknown_vote_count"]),
-                f"{end_prefix}_unknown_vote_count": int(end_metrics["unknown_vote_count"]),
-                "unknown_vote_count_change": int(end_metrics["unknown_vote_count"])
-                - int(start_metrics["unknown_vote_count"]),
-                f"{start_prefix}_yes_count": int(start_metrics["yes_count"]),
-                f"{end_prefix}_yes_count": int(end_metrics["yes_count"]),
-                "yes_count_change": int(end_metrics["yes_count"]) - int(start_metrics["yes_count"]),
-                f"{start_prefix}_yes_pct": format_pct(start_yes_pct),
-                f"{end_prefix}_yes_pct": format_pct(end_yes_pct),
-                "yes_pct_change_pp": format_pct(yes_pct_change),
-                f"{start_prefix}_abstain_count": int(start_metrics["abstain_count"]),
-                f"{end_prefix}_abstain_count": int(end_metrics["abstain_count"]),
-                "abstain_count_change": int(end_metrics["abstain_count"])
-                - int(start_metrics["abstain_count"]),
-                f"{start_prefix}_abstain_pct": format_pct(start_abstain_pct),
-                f"{end_prefix}_abstain_pct": format_pct(end_abstain_pct),
-                "abstain_pct_change_pp": format_pct(abstain_pct_change),
-                f"{start_prefix}_no_count": int(start_metrics["no_count"]),
-                f"{end_prefix}_no_count": int(end_metrics["no_count"]),
-                "no_count_change": int(end_metrics["no_count"]) - int(start_metrics["no_count"]),
-                f"{start_prefix}_no_pct": format_pct(start_no_pct),
-                f"{end_prefix}_no_pct": format_pct(end_no_pct),
-                "no_pct_change_pp": format_pct(no_pct_change),
-                "abs_yes_pct_change_pp": format_pct(
-                    abs(yes_pct_change) if yes_pct_change is not None else None
-                ),
             }
+            for metric, start_field, end_field, change_field in count_specs:
+                start_value = int(start_metrics[metric])
+                end_value = int(end_metrics[metric])
+                row[start_field] = start_value
+                row[end_field] = end_value
+                row[change_field] = end_value - start_value
+
+            pct_changes: list[float | None] = []
+            for (
+                count_key,
+                start_count,
+                end_count,
+                count_change,
+                pct_key,
+                start_pct,
+                end_pct,
+                pct_change,
+            ) in vote_specs:
+                start_value = int(start_metrics[count_key])
+                end_value = int(end_metrics[count_key])
+                row[start_count] = start_value
+                row[end_count] = end_value
+                row[count_change] = end_value - start_value
+
+                start_pct_value = start_metrics[pct_key]
+                end_pct_value = end_metrics[pct_key]
+                pct_change_value = None
+                if start_pct_value is not None and end_pct_value is not None:
+                    pct_change_value = end_pct_value - start_pct_value
+                row[start_pct] = format_pct(start_pct_value)
+                row[end_pct] = format_pct(end_pct_value)
+                row[pct_change] = format_pct(pct_change_value)
+                pct_changes.append(pct_change_value)
+
+            yes_pct_change = pct_changes[0]
+            row["abs_yes_pct_change_pp"] = format_pct(
+                abs(yes_pct_change) if yes_pct_change is not None else None
+            )
             rows.append(row)
 
     status_rank = {
@@ -334,10 +323,12 @@ def build_change_rows_for_level(
         "DROPPED_FROM_2024": 2,
     }
 
+    end_resolution_field = f"{end_prefix}_resolution_count"
+
     def sort_key(row: dict[str, int | str]) -> tuple[object, ...]:
         abs_change_raw = row["abs_yes_pct_change_pp"]
         abs_change = float(abs_change_raw) if abs_change_raw != "" else -1.0
-        end_resolution_count = int(row[f"{end_prefix}_resolution_count"])
+        end_resolution_count = int(row[end_resolution_field])
         return (
             row["country"],
             status_rank[row["status"]],
@@ -459,6 +450,10 @@ def main() -> None:
         "no_pct_change_pp",
         "abs_yes_pct_change_pp",
     ]
+    # Everything after country/topic_level/topic_label is copied as-is from the
+    # per-level change rows, which use the same column names
+    change_value_fields = change_fieldnames[3:]
+    end_resolution_field = f"{args.end_year}_resolution_count"
 
     for level in levels:
         topic_field = level
@@ -531,59 +526,7 @@ def main() -> None:
                 "country": row["country"],
                 "topic_level": level,
                 "topic_label": row[topic_field],
-                "status": row["status"],
-                f"{args.start_year}_resolution_count": row[f"{args.start_year}_resolution_count"],
-                f"{args.end_year}_resolution_count": row[f"{args.end_year}_resolution_count"],
-                "resolution_count_change": row["resolution_count_change"],
-                f"{args.start_year}_recorded_vote_count": row[
-                    f"{args.start_year}_recorded_vote_count"
-                ],
-                f"{args.end_year}_recorded_vote_count": row[
-                    f"{args.end_year}_recorded_vote_count"
-                ],
-                "recorded_vote_count_change": row["recorded_vote_count_change"],
-                f"{args.start_year}_not_recorded_count": row[
-                    f"{args.start_year}_not_recorded_count"
-                ],
-                f"{args.end_year}_not_recorded_count": row[
-                    f"{args.end_year}_not_recorded_count"
-                ],
-                "not_recorded_count_change": row["not_recorded_count_change"],
-                f"{args.start_year}_country_missing_count": row[
-                    f"{args.start_year}_country_missing_count"
-                ],
-                f"{args.end_year}_country_missing_count": row[
-                    f"{args.end_year}_country_missing_count"
-                ],
-                "country_missing_count_change": row["country_missing_count_change"],
-                f"{args.start_year}_unknown_vote_count": row[
-                    f"{args.start_year}_unknown_vote_count"
-                ],
-                f"{args.end_year}_unknown_vote_count": row[
-                    f"{args.end_year}_unknown_vote_count"
-                ],
-                "unknown_vote_count_change": row["unknown_vote_count_change"],
-                f"{args.start_year}_yes_count": row[f"{args.start_year}_yes_count"],
-                f"{args.end_year}_yes_count": row[f"{args.end_year}_yes_count"],
-                "yes_count_change": row["yes_count_change"],
-                f"{args.start_year}_yes_pct": row[f"{args.start_year}_yes_pct"],
-                f"{args.end_year}_yes_pct": row[f"{args.end_year}_yes_pct"],
-                "yes_pct_change_pp": row["yes_pct_change_pp"],
-                f"{args.start_year}_abstain_count": row[
-                    f"{args.start_year}_abstain_count"
-                ],
-                f"{args.end_year}_abstain_count": row[f"{args.end_year}_abstain_count"],
-                "abstain_count_change": row["abstain_count_change"],
-                f"{args.start_year}_abstain_pct": row[f"{args.start_year}_abstain_pct"],
-                f"{args.end_year}_abstain_pct": row[f"{args.end_year}_abstain_pct"],
-                "abstain_pct_change_pp": row["abstain_pct_change_pp"],
-                f"{args.start_year}_no_count": row[f"{args.start_year}_no_count"],
-                f"{args.end_year}_no_count": row[f"{args.end_year}_no_count"],
-                "no_count_change": row["no_count_change"],
-                f"{args.start_year}_no_pct": row[f"{args.start_year}_no_pct"],
-                f"{args.end_year}_no_pct": row[f"{args.end_year}_no_pct"],
-                "no_pct_change_pp": row["no_pct_change_pp"],
-                "abs_yes_pct_change_pp": row["abs_yes_pct_change_pp"],
+                **{field: row[field] for field in change_value_fields},
             }
             for row in level_change_rows
         )
@@ -605,7 +548,7 @@ def main() -> None:
             row["topic_level"],
             0 if row["status"] == "PRESENT_IN_BOTH" else 1 if row["status"] == "NEW_IN_2025" else 2,
             -(float(row["abs_yes_pct_change_pp"]) if row["abs_yes_pct_change_pp"] != "" else -1.0),
-            -int(row[f"{args.end_year}_resolution_count"]),
+            -int(row[end_resolution_field]),
             row["topic_label"],
         )
     )
@@ -618,6 +561,7 @@ def main() -> None:
     print(f"Wrote {combined_long_path}")
     print(f"Wrote {combined_change_path}")
     print(f"Input rows read: {diagnostics['input_rows']}")
+    print(f"Rows skipped as blank/short: {diagnostics['skipped_short_row']}")
     print(f"Rows skipped for sc_flag: {diagnostics['skipped_sc_flag']}")
     print(
         "Rows skipped for date/year filter: "
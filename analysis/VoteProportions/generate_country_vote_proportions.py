@@ -54,15 +54,27 @@ def read_country_yearly_counts(
     diagnostics: Counter[str] = Counter()
 
     with input_path.open(newline="", encoding="utf-8-sig") as handle:
-        reader = csv.DictReader(handle)
+        # Plain csv.reader plus header positions: only four of the columns are
+        # read, so there is no need to build a dict for every row
+        reader = csv.reader(handle)
+        header = next(reader)
+        sc_flag_idx = header.index("sc_flag")
+        date_idx = header.index("Date")
+        resolution_idx = header.index("Resolution")
+        vote_data_idx = header.index("vote_data")
+        row_width = max(sc_flag_idx, date_idx, resolution_idx, vote_data_idx) + 1
         for row in reader:
             diagnostics["input_rows"] += 1
+            # csv.reader yields blank lines as [] and keeps ragged rows short
+            if len(row) < row_width:
+                diagnostics["skipped_short_row"] += 1
+                continue
 
-            if str(row.get("sc_flag", "")).strip() != sc_flag:
+            if row[sc_flag_idx].strip() != sc_flag:
                 diagnostics["skipped_sc_flag"] += 1
                 continue
 
-            year = parse_year(row.get("Date", ""))
+            year = parse_year(row[date_idx])
             if year is None:
                 diagnostics["skipped_bad_date"] += 1
                 continue
@@ -70,9 +82,9 @@ def read_country_yearly_counts(
                 diagnostics["skipped_year_range"] += 1
                 continue
 
-            resolution = row.get("Resolution", "")
+            resolution = row[resolution_idx]
             try:
-                vote_data: Any = json.loads(row.get("vote_data", ""))
+                vote_data: Any = json.loads(row[vote_data_idx])
             except json.JSONDecodeError as exc:
                 raise ValueError(f"Invalid vote_data JSON for {resolution}") from exc
             if not isinstance(vote_data, dict):
@@ -298,6 +310,7 @@ def main() -> None:
     print(f"Wrote {args.change_output}")
     print(f"Country-year rows: {len(long_rows)}")
     print(f"Input rows read: {diagnostics['input_rows']}")
+    print(f"Rows skipped as blank/short: {diagnostics['skipped_short_row']}")
     print(f"Rows skipped for sc_flag: {diagnostics['skipped_sc_flag']}")
     print(
         "Rows skipped for date/year filter: "